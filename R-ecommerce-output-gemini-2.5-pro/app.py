@@ -1,3 +1,6 @@
+import sys
+from functools import lru_cache
+
 import gradio as gr
 from ecommerce import Ecommerce, EcommerceError
 
@@ -7,66 +10,110 @@ from ecommerce import Ecommerce, EcommerceError
 
 ecommerce_system = Ecommerce()
 
-# Create a single user for this demo
+# A single user for this demo
 USER_ID = "user_01"
-ecommerce_system.add_user(USER_ID, "Demo User", 150.00)
-
-# Add some products to the store catalog
-ecommerce_system.add_product("p_001", "Laptop", 50.0)
-ecommerce_system.add_product("p_002", "Mouse", 5.0)
-ecommerce_system.add_product("p_003", "Keyboard", 10.0)
-ecommerce_system.add_product("p_004", "Monitor", 75.0)
-
-# Create a list of choices for the Gradio dropdown component
-PRODUCT_CHOICES = [
-    ("Laptop ($50.00)", "p_001"),
-    ("Mouse ($5.00)", "p_002"),
-    ("Keyboard ($10.00)", "p_003"),
-    ("Monitor ($75.00)", "p_004")
-]
+
+# Filled in by seed_backend(). The catalog and demo user are fixed once seeded,
+# so they are resolved a single time instead of on every UI refresh.
+PRODUCT_NAMES = {}
+PRODUCT_CHOICES = []
+USER = None
+
+def seed_backend():
+    """
+    Creates the demo user and product catalog and derives the UI lookups.
+    Runs once; later calls keep the existing user, carts and orders.
+    """
+    global USER
+    if USER is not None:
+        return
+    ecommerce_system.add_user(USER_ID, "Demo User", 150.00)
+
+    # Add some products to the store catalog
+    ecommerce_system.add_products([
+        ("p_001", "Laptop", 50.0),
+        ("p_002", "Mouse", 5.0),
+        ("p_003", "Keyboard", 10.0),
+        ("p_004", "Monitor", 75.0),
+    ])
+
+    products = ecommerce_system._products
+    PRODUCT_NAMES.update({pid: p.name for pid, p in products.items()})
+    USER = ecommerce_system._users[USER_ID]
+
+    # Choices for the Gradio dropdown component, derived from the catalog so
+    # the labels can never drift from the backend prices
+    PRODUCT_CHOICES[:] = [(f"{p.name} (${p.price_cents / 100:.2f})", pid) for pid, p in products.items()]
 
 # --- UI Helper Functions ---
 # These functions format the data from the backend for display in the UI.
 
+CART_LINE_FORMAT = "- %s (ID: %s)\n  Quantity: %d @ $%.2f each\n  Subtotal: $%.2f"
+ORDER_LINE_FORMAT = "  - %d x %s (%s)"
+
 def format_balance():
     """Returns a formatted string for the user's current balance."""
-    balance = ecommerce_system._users[USER_ID]['balance']
-    return f"**User:** {ecommerce_system._users[USER_ID]['name']} | **Current Balance:** ${balance:.2f}"
+    return f"**User:** {USER.name} | **Current Balance:** ${USER.balance_cents / 100:.2f}"
 
 def format_cart():
     """Returns a formatted string of the cart's contents."""
-    cart_data = ecommerce_system.view_cart(USER_ID)
+    return _render_cart(USER_ID, ecommerce_system.get_cart_version(USER_ID))
+
+@lru_cache(maxsize=4)
+def _render_cart(user_id, cart_version):
+    """Renders the cart; cached until the cart version changes."""
+    cart_data = ecommerce_system.view_cart(user_id)
     if not cart_data["items"]:
         return "Your cart is empty."
     
-    display_text = []
-    for item in cart_data["items"]:
-        display_text.append(
-            f"- {item['name']} (ID: {item['product_id']})\n"
-            f"  Quantity: {item['quantity']} @ ${item['price']:.2f} each\n"
-            f"  Subtotal: ${item['subtotal']:.2f}"
+    items = cart_data["items"]
+    display_text = [None] * (len(items) + 2)
+    for i, item in enumerate(items):
+        display_text[i] = CART_LINE_FORMAT % (
+            item['name'], item['product_id'], item['quantity'], item['price'], item['subtotal']
         )
-    display_text.append("--------------------")
-    display_text.append(f"TOTAL: ${cart_data['total_value']:.2f}")
+    display_text[-2] = "--------------------"
+    display_text[-1] = "TOTAL: $%.2f" % cart_data['total_value']
     return "\n".join(display_text)
 
 def format_order_history():
     """Returns a formatted string of the user's order history."""
-    history = ecommerce_system.get_order_history(USER_ID)
+    return _render_order_history(USER_ID, ecommerce_system.get_orders_version(USER_ID))
+
+# Only the newest orders are rendered, which also bounds the per-order text cache
+MAX_ORDERS_SHOWN = 50
+
+# order_id -> rendered text for the orders currently shown, newest first. Orders never
+# change once placed, so each one is rendered only the first time it is shown.
+_ORDER_TEXT = {}
+
+@lru_cache(maxsize=4)
+def _render_order_history(user_id, orders_version):
+    """Renders the order history; cached until a new order is placed."""
+    global _ORDER_TEXT
+    history = ecommerce_system.get_order_history(user_id)
     if not history:
         return "No past orders found."
 
-    display_text = []
-    for order in reversed(history): # Show most recent first
-        display_text.append(f"Order ID: {order['order_id']}")
-        display_text.append(f"Date: {order['timestamp']}")
-        display_text.append("Items:")
-        for product_id, quantity in order['items'].items():
-             product_name = ecommerce_system._products.get(product_id, {}).get('name', 'Unknown Product')
-             display_text.append(f"  - {quantity} x {product_name} ({product_id})")
-        display_text.append(f"Total: ${order['total_value']:.2f}")
-        display_text.append("--------------------")
-    return "\n".join(display_text)
+    # Already most recent first; orders that drop out of the window are forgotten
+    previous = _ORDER_TEXT
+    _ORDER_TEXT = {
+        order['order_id']: previous.get(order['order_id']) or _render_order(order)
+        for order in history[:MAX_ORDERS_SHOWN]
+    }
+    text = "\n".join(_ORDER_TEXT.values())
+    hidden = len(history) - MAX_ORDERS_SHOWN
+    if hidden > 0:
+        text += "\n(%d older orders not shown)" % hidden
+    return text
+
+def _render_order(order):
+    """Renders the display block for a single order."""
+    lines = ["Order ID: %s\nDate: %s\nItems:" % (order['order_id'], order['timestamp'])]
+    for product_id, quantity in order['items'].items():
+        lines.append(ORDER_LINE_FORMAT % (quantity, PRODUCT_NAMES.get(product_id, 'Unknown Product'), product_id))
+    lines.append("Total: $%.2f\n--------------------" % order['total_value'])
+    return "\n".join(lines)
 
 # --- Gradio Action Handlers ---
 # These functions are called when the user interacts with the UI components.
@@ -74,30 +121,32 @@ def format_order_history():
 def add_item_action(product_id, quantity):
     """Handles the 'Add to Cart' button click."""
     if not product_id:
-        return format_balance(), format_cart(), format_order_history(), "Error: Please select a product."
+        return format_cart(), "Error: Please select a product."
+    product_id = sys.intern(product_id)
     try:
         quantity = int(quantity)
         ecommerce_system.add_to_cart(USER_ID, product_id, quantity)
-        product_name = ecommerce_system._products[product_id]['name']
+        product_name = PRODUCT_NAMES.get(product_id, product_id)
         status = f"Success: Added {quantity} x {product_name} to your cart."
     except (EcommerceError, ValueError) as e:
         status = f"Error: {e}"
     
-    return format_balance(), format_cart(), format_order_history(), status
+    return format_cart(), status
 
 def remove_item_action(product_id, quantity):
     """Handles the 'Remove from Cart' button click."""
     if not product_id:
-        return format_balance(), format_cart(), format_order_history(), "Error: Please select a product."
+        return format_cart(), "Error: Please select a product."
+    product_id = sys.intern(product_id)
     try:
         quantity = int(quantity)
         ecommerce_system.remove_from_cart(USER_ID, product_id, quantity)
-        product_name = ecommerce_system._products[product_id]['name']
+        product_name = PRODUCT_NAMES.get(product_id, product_id)
         status = f"Success: Removed {quantity} x {product_name} from your cart."
     except (EcommerceError, ValueError) as e:
         status = f"Error: {e}"
     
-    return format_balance(), format_cart(), format_order_history(), status
+    return format_cart(), status
 
 def checkout_action():
     """Handles the 'Checkout' button click."""
@@ -111,78 +160,88 @@ def checkout_action():
 
 
 # --- Gradio UI Definition ---
-# This block defines the layout and components of the web interface.
+# The backend seeding and UI construction run on demand so that importing
+# this module stays cheap.
+
+def build_demo() -> gr.Blocks:
+    """Seeds the backend and builds the Gradio interface."""
+    seed_backend()
+
+    with gr.Blocks(theme=gr.themes.Soft(), title="E-commerce Demo") as demo:
+        gr.Markdown("# Simple E-commerce System Demo")
+
+        balance_display = gr.Markdown(value=format_balance)
+
+        with gr.Row():
+            with gr.Column(scale=1):
+                gr.Markdown("## Manage Your Cart")
+                product_dropdown = gr.Dropdown(
+                    choices=PRODUCT_CHOICES, 
+                    label="Select a Product"
+                )
+                quantity_input = gr.Number(
+                    value=1, 
+                    label="Quantity", 
+                    minimum=1, 
+                    step=1
+                )
+                with gr.Row():
+                    add_button = gr.Button("Add to Cart")
+                    remove_button = gr.Button("Remove from Cart")
+
+                gr.Markdown("---")
+                gr.Markdown("## Finalize Purchase")
+                checkout_button = gr.Button("Checkout", variant="primary")
+
+                status_display = gr.Textbox(
+                    label="Status Message",
+                    value="Welcome! Add items to your cart.",
+                    interactive=False
+                )
+
+            with gr.Column(scale=2):
+                cart_display = gr.Textbox(
+                    value=format_cart,
+                    label="🛒 Your Cart",
+                    lines=10,
+                    interactive=False,
+                    autoscroll=True
+                )
+                history_display = gr.Textbox(
+                    value=format_order_history,
+                    label="📜 Order History",
+                    lines=10,
+                    interactive=False,
+                    autoscroll=True
+                )
+
+        # --- Component Wiring ---
+        # Connect the buttons to their respective action functions.
+        # The outputs update the display components on the right.
+        # Adding or removing items only changes the cart, so those buttons skip
+        # re-rendering the balance and order history.
+        cart_outputs = [cart_display, status_display]
+        outputs_to_update = [balance_display, cart_display, history_display, status_display]
+
+        add_button.click(
+            fn=add_item_action,
+            inputs=[product_dropdown, quantity_input],
+            outputs=cart_outputs
+        )
 
-with gr.Blocks(theme=gr.themes.Soft(), title="E-commerce Demo") as demo:
-    gr.Markdown("# Simple E-commerce System Demo")
-    
-    balance_display = gr.Markdown(value=format_balance)
-
-    with gr.Row():
-        with gr.Column(scale=1):
-            gr.Markdown("## Manage Your Cart")
-            product_dropdown = gr.Dropdown(
-                choices=PRODUCT_CHOICES, 
-                label="Select a Product"
-            )
-            quantity_input = gr.Number(
-                value=1, 
-                label="Quantity", 
-                minimum=1, 
-                step=1
-            )
-            with gr.Row():
-                add_button = gr.Button("Add to Cart")
-                remove_button = gr.Button("Remove from Cart")
-            
-            gr.Markdown("---")
-            gr.Markdown("## Finalize Purchase")
-            checkout_button = gr.Button("Checkout", variant="primary")
-            
-            status_display = gr.Textbox(
-                label="Status Message",
-                value="Welcome! Add items to your cart.",
-                interactive=False
-            )
-
-        with gr.Column(scale=2):
-            cart_display = gr.Textbox(
-                value=format_cart,
-                label="🛒 Your Cart",
-                lines=10,
-                interactive=False,
-                autoscroll=True
-            )
-            history_display = gr.Textbox(
-                value=format_order_history,
-                label="📜 Order History",
-                lines=10,
-                interactive=False,
-                autoscroll=True
-            )
-
-    # --- Component Wiring ---
-    # Connect the buttons to their respective action functions.
-    # The outputs update the display components on the right.
-    outputs_to_update = [balance_display, cart_display, history_display, status_display]
-
-    add_button.click(
-        fn=add_item_action,
-        inputs=[product_dropdown, quantity_input],
-        outputs=outputs_to_update
-    )
-    
-    remove_button.click(
-        fn=remove_item_action,
-        inputs=[product_dropdown, quantity_input],
-        outputs=outputs_to_update
-    )
-    
-    checkout_button.click(
-        fn=checkout_action,
-        inputs=[],
-        outputs=outputs_to_update
-    )
+        remove_button.click(
+            fn=remove_item_action,
+            inputs=[product_dropdown, quantity_input],
+            outputs=cart_outputs
+        )
+
+        checkout_button.click(
+            fn=checkout_action,
+            inputs=[],
+            outputs=outputs_to_update
+        )
+
+    return demo
 
 if __name__ == "__main__":
-    demo.launch()
\ No newline at end of file
+    build_demo().launch()
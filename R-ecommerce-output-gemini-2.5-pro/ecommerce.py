@@ -1,6 +1,8 @@
-import uuid
-from datetime import datetime
-from typing import Dict, List, Any
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import uuid4 as _uuid4
+from typing import Dict, Iterable, List, Tuple, Any
 
 # 2.1. Custom Exception Classes
 class EcommerceError(Exception):
@@ -24,7 +26,28 @@ class EmptyCartError(EcommerceError):
     pass
 
 
-# 2.2. Main Class: Ecommerce
+# 2.2. Data Records
+# Money is held as integer cents internally so balances never accumulate
+# float rounding error; the public methods still take and return dollars.
+@dataclass(slots=True)
+class Product:
+    """A catalog entry."""
+    name: str
+    price_cents: int
+
+@dataclass(slots=True)
+class User:
+    """A registered user and their available funds."""
+    name: str
+    balance_cents: int
+
+
+def _to_cents(amount: float) -> int:
+    """Converts a dollar amount to integer cents."""
+    return int(round(amount * 100))
+
+
+# 2.3. Main Class: Ecommerce
 class Ecommerce:
     """
     Core class for the simple e-commerce system. It manages all data and
@@ -36,10 +59,13 @@ class Ecommerce:
         Initializes a new instance of the Ecommerce system. It sets up the empty
         in-memory data stores for products, users, carts, and orders.
         """
-        self._products: Dict[str, Dict[str, Any]] = {}
-        self._users: Dict[str, Dict[str, Any]] = {}
-        self._carts: Dict[str, Dict[str, int]] = {}
+        self._products: Dict[str, Product] = {}
+        self._users: Dict[str, User] = {}
+        self._carts: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self._orders: Dict[str, List[Dict[str, Any]]] = {}
+        self._cart_totals: Dict[str, int] = {}
+        self._cart_version: Dict[str, int] = {}
+        self._orders_version: Dict[str, int] = {}
 
     # Setup Methods
     def add_product(self, product_id: str, name: str, price: float) -> None:
@@ -56,7 +82,8 @@ class Ecommerce:
         """
         if price < 0:
             raise ValueError("Price cannot be negative.")
-        self._products[product_id] = {'name': name, 'price': price}
+        # Interned keys let later lookups short-circuit on identity
+        self._products[sys.intern(product_id)] = Product(name, _to_cents(price))
 
     def add_user(self, user_id: str, name: str, initial_balance: float) -> None:
         """
@@ -72,7 +99,42 @@ class Ecommerce:
         """
         if initial_balance < 0:
             raise ValueError("Initial balance cannot be negative.")
-        self._users[user_id] = {'name': name, 'balance': initial_balance}
+        self._users[sys.intern(user_id)] = User(name, _to_cents(initial_balance))
+
+    def add_products(self, products: Iterable[Tuple[str, str, float]]) -> None:
+        """
+        Adds several products to the catalog in one batch. Nothing is added
+        if any entry is invalid.
+
+        Args:
+            products: (product_id, name, price) tuples.
+
+        Raises:
+            ValueError: If any price is negative.
+        """
+        products = list(products)
+        if any(price < 0 for _, _, price in products):
+            raise ValueError("Price cannot be negative.")
+        self._products.update(
+            (sys.intern(pid), Product(name, _to_cents(price))) for pid, name, price in products
+        )
+
+    def add_users(self, users: Iterable[Tuple[str, str, float]]) -> None:
+        """
+        Adds several users in one batch. Nothing is added if any entry is invalid.
+
+        Args:
+            users: (user_id, name, initial_balance) tuples.
+
+        Raises:
+            ValueError: If any initial balance is negative.
+        """
+        users = list(users)
+        if any(balance < 0 for _, _, balance in users):
+            raise ValueError("Initial balance cannot be negative.")
+        self._users.update(
+            (sys.intern(uid), User(name, _to_cents(balance))) for uid, name, balance in users
+        )
 
     # Cart Management Methods
     def add_to_cart(self, user_id: str, product_id: str, quantity: int = 1) -> None:
@@ -89,18 +151,29 @@ class Ecommerce:
             ProductNotFoundError: If the product_id does not exist.
             ValueError: If the quantity is not a positive integer.
         """
-        if user_id not in self._users:
-            raise UserNotFoundError(f"User '{user_id}' not found.")
-        if product_id not in self._products:
-            raise ProductNotFoundError(f"Product '{product_id}' not found.")
-        if not isinstance(quantity, int) or quantity <= 0:
+        if type(quantity) is not int or quantity <= 0:
             raise ValueError("Quantity must be a positive integer.")
+        self._require_user(user_id)
+        product_info = self._require_product(product_id)
+
+        price_cents = product_info.price_cents
+        cart = self._carts.setdefault(user_id, {})
+        entry = cart.get(product_id)
+        if entry is None:
+            cart[product_id] = {
+                'name': product_info.name,
+                'price_cents': price_cents,
+                'quantity': quantity,
+                'subtotal_cents': price_cents * quantity,
+            }
+        else:
+            new_quantity = entry['quantity'] + quantity
+            entry['quantity'] = new_quantity
+            entry['subtotal_cents'] = price_cents * new_quantity
 
-        if user_id not in self._carts:
-            self._carts[user_id] = {}
-
-        current_quantity = self._carts[user_id].get(product_id, 0)
-        self._carts[user_id][product_id] = current_quantity + quantity
+        cart_totals = self._cart_totals
+        cart_totals[user_id] = cart_totals.get(user_id, 0) + price_cents * quantity
+        self._bump_version(self._cart_version, user_id)
 
     def remove_from_cart(self, user_id: str, product_id: str, quantity: int = 1) -> None:
         """
@@ -116,26 +189,33 @@ class Ecommerce:
             UserNotFoundError: If the user_id does not exist.
             ValueError: If the quantity is not a positive integer.
         """
-        if user_id not in self._users:
-            raise UserNotFoundError(f"User '{user_id}' not found.")
-        if not isinstance(quantity, int) or quantity <= 0:
+        if type(quantity) is not int or quantity <= 0:
             raise ValueError("Quantity must be a positive integer.")
+        self._require_user(user_id)
 
         user_cart = self._carts.get(user_id)
-        if not user_cart or product_id not in user_cart:
+        if not user_cart:
             return  # Silently do nothing as per design
+        entry = user_cart.get(product_id)
+        if entry is None:
+            return
 
-        current_quantity = user_cart.get(product_id, 0)
+        current_quantity = entry['quantity']
         new_quantity = current_quantity - quantity
 
-        if new_quantity <= 0:
-            del self._carts[user_id][product_id]
+        if new_quantity > 0:
+            entry['quantity'] = new_quantity
+            entry['subtotal_cents'] = entry['price_cents'] * new_quantity
+            self._cart_totals[user_id] -= entry['price_cents'] * quantity
         else:
-            self._carts[user_id][product_id] = new_quantity
-            
-        if not self._carts[user_id]: # Clean up empty cart dict
-             del self._carts[user_id]
+            del user_cart[product_id]
+            if user_cart:
+                self._cart_totals[user_id] -= entry['subtotal_cents']
+            else: # Clean up empty cart dict and its total in one pass
+                self._carts.pop(user_id, None)
+                self._cart_totals.pop(user_id, None)
 
+        self._bump_version(self._cart_version, user_id)
 
     def view_cart(self, user_id: str) -> Dict[str, Any]:
         """
@@ -150,31 +230,56 @@ class Ecommerce:
         Raises:
             UserNotFoundError: If the user_id does not exist.
         """
-        if user_id not in self._users:
-            raise UserNotFoundError(f"User '{user_id}' not found.")
+        self._require_user(user_id)
 
-        user_cart = self._carts.get(user_id, {})
-        if not user_cart:
+        try:
+            user_cart = self._carts[user_id]
+        except KeyError:
+            # Emptied carts are dropped, so a missing entry means an empty cart
             return {"items": [], "total_value": 0.0}
 
-        cart_details = {"items": [], "total_value": 0.0}
-        total_value = 0.0
-
-        for product_id, quantity in user_cart.items():
-            product_info = self._products.get(product_id)
-            if product_info:
-                subtotal = product_info['price'] * quantity
-                cart_details["items"].append({
-                    "product_id": product_id,
-                    "name": product_info['name'],
-                    "price": product_info['price'],
-                    "quantity": quantity,
-                    "subtotal": subtotal
-                })
-                total_value += subtotal
-
-        cart_details["total_value"] = total_value
-        return cart_details
+        # Entries already carry name, price and subtotal, so no catalog lookups are needed
+        items = [
+            {
+                "product_id": product_id,
+                "name": entry['name'],
+                "price": entry['price_cents'] / 100,
+                "quantity": entry['quantity'],
+                "subtotal": entry['subtotal_cents'] / 100,
+            }
+            for product_id, entry in user_cart.items()
+        ]
+        return {"items": items, "total_value": self._cart_totals[user_id] / 100}
+
+    def get_cart_total(self, user_id: str) -> float:
+        """
+        Returns the total value of a user's shopping cart without building
+        the per-item breakdown.
+
+        Args:
+            user_id: The ID of the user whose cart total to read.
+
+        Returns:
+            The cached total value of the cart, or 0.0 if the cart is empty.
+
+        Raises:
+            UserNotFoundError: If the user_id does not exist.
+        """
+        self._require_user(user_id)
+
+        return self._cart_totals.get(user_id, 0) / 100
+
+    def get_cart_version(self, user_id: str) -> int:
+        """
+        Returns a counter that changes every time the user's cart is modified.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            The current cart version, or 0 if the cart was never modified.
+        """
+        return self._cart_version.get(user_id, 0)
 
     # Checkout and Order Methods
     def checkout(self, user_id: str) -> str:
@@ -192,45 +297,43 @@ class Ecommerce:
             EmptyCartError: If the user's cart is empty.
             InsufficientFundsError: If the user's balance is less than the cart total.
         """
-        if user_id not in self._users:
-            raise UserNotFoundError(f"User '{user_id}' not found.")
+        user = self._require_user(user_id)
 
-        user_cart_data = self.view_cart(user_id)
-        cart_total = user_cart_data["total_value"]
-
-        if not user_cart_data["items"]:
+        user_cart = self._carts.get(user_id)
+        if not user_cart:
             raise EmptyCartError(f"Cart for user '{user_id}' is empty.")
 
-        user_balance = self._users[user_id]['balance']
+        cart_total_cents = self._cart_totals[user_id]
+        user_balance_cents = user.balance_cents
 
-        if cart_total > user_balance:
+        if cart_total_cents > user_balance_cents:
             raise InsufficientFundsError(
                 f"Insufficient funds for user '{user_id}'. "
-                f"Balance: {user_balance}, Required: {cart_total}"
+                f"Balance: {user_balance_cents / 100}, Required: {cart_total_cents / 100}"
             )
 
         # Process the order
-        self._users[user_id]['balance'] -= cart_total
+        user.balance_cents = user_balance_cents - cart_total_cents
+
+        order_id = _uuid4().hex
 
-        order_id = str(uuid.uuid4())
-        
-        # We need a copy of the items, not just the product IDs
-        order_items = self._carts.get(user_id, {}).copy()
+        # Detach the cart and keep only the quantities in the order record
+        order_items = {product_id: entry['quantity'] for product_id, entry in user_cart.items()}
+        del self._carts[user_id]
 
         order_record = {
             "order_id": order_id,
             "items": order_items,
-            "total_value": cart_total,
-            "timestamp": datetime.utcnow().isoformat()
+            "total_value": cart_total_cents / 100,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds')
         }
 
-        if user_id not in self._orders:
-            self._orders[user_id] = []
-        self._orders[user_id].append(order_record)
+        # Keep history most-recent-first so readers never need to reverse it
+        self._orders.setdefault(user_id, []).insert(0, order_record)
 
-        # Clear the cart
-        if user_id in self._carts:
-            del self._carts[user_id]
+        self._cart_totals.pop(user_id, None)
+        self._bump_version(self._cart_version, user_id)
+        self._bump_version(self._orders_version, user_id)
 
         return order_id
 
@@ -242,13 +345,45 @@ class Ecommerce:
             user_id: The ID of the user.
 
         Returns:
-            A list of order dictionaries for the user. Returns an empty list
-            if the user has no orders.
+            A list of order dictionaries for the user, most recent first.
+            Returns an empty list if the user has no orders.
 
         Raises:
             UserNotFoundError: If the user_id does not exist.
         """
-        if user_id not in self._users:
+        self._require_user(user_id)
+
+        return self._orders.get(user_id, [])
+
+    def get_orders_version(self, user_id: str) -> int:
+        """
+        Returns a counter that changes every time an order is added to the
+        user's history.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            The current order history version, or 0 if no order was placed.
+        """
+        return self._orders_version.get(user_id, 0)
+
+    # Internal Helpers
+    def _require_user(self, user_id: str) -> User:
+        """Returns the user record, raising UserNotFoundError if it does not exist."""
+        user = self._users.get(user_id)
+        if user is None:
             raise UserNotFoundError(f"User '{user_id}' not found.")
+        return user
+
+    def _require_product(self, product_id: str) -> Product:
+        """Returns the product record, raising ProductNotFoundError if it does not exist."""
+        product = self._products.get(product_id)
+        if product is None:
+            raise ProductNotFoundError(f"Product '{product_id}' not found.")
+        return product
 
-        return self._orders.get(user_id, [])
\ No newline at end of file
+    @staticmethod
+    def _bump_version(versions: Dict[str, int], user_id: str) -> None:
+        """Increments the change counter stored for a user."""
+        versions[user_id] = versions.get(user_id, 0) + 1
\ No newline at end of file
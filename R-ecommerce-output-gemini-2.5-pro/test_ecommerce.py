@@ -24,20 +24,43 @@ class TestEcommerce(unittest.TestCase):
         """Test adding a product with valid data."""
         self.ecommerce.add_product("prod3", "Keyboard", 25.0)
         self.assertIn("prod3", self.ecommerce._products)
-        self.assertEqual(self.ecommerce._products["prod3"]["name"], "Keyboard")
-        self.assertEqual(self.ecommerce._products["prod3"]["price"], 25.0)
+        self.assertEqual(self.ecommerce._products["prod3"].name, "Keyboard")
+        self.assertEqual(self.ecommerce._products["prod3"].price_cents, 2500)
 
     def test_add_product_negative_price(self):
         """Test that adding a product with a negative price raises ValueError."""
         with self.assertRaises(ValueError):
             self.ecommerce.add_product("prod_invalid", "Faulty Item", -10.0)
 
+    def test_add_products_batch(self):
+        """Test bulk-adding products, and that an invalid entry adds nothing."""
+        self.ecommerce.add_products([("prod3", "Keyboard", 25.0), ("prod4", "Monitor", 120.0)])
+        self.assertEqual(self.ecommerce._products["prod4"].price_cents, 12000)
+        with self.assertRaises(ValueError):
+            self.ecommerce.add_products([("prod5", "Cable", 5.0), ("prod6", "Faulty Item", -1.0)])
+        self.assertNotIn("prod5", self.ecommerce._products)
+        # Validated before rounding to cents, same as add_product
+        with self.assertRaises(ValueError):
+            self.ecommerce.add_products([("prod7", "Rounding", -0.004)])
+        self.assertNotIn("prod7", self.ecommerce._products)
+
+    def test_add_users_batch(self):
+        """Test bulk-adding users, and that an invalid entry adds nothing."""
+        self.ecommerce.add_users([("user3", "Charlie", 500.0)])
+        self.assertEqual(self.ecommerce._users["user3"].balance_cents, 50000)
+        with self.assertRaises(ValueError):
+            self.ecommerce.add_users([("user4", "David", 5.0), ("user5", "Eve", -5.0)])
+        self.assertNotIn("user4", self.ecommerce._users)
+        with self.assertRaises(ValueError):
+            self.ecommerce.add_users([("user6", "Frank", -0.004)])
+        self.assertNotIn("user6", self.ecommerce._users)
+
     def test_add_user_success(self):
         """Test adding a user with valid data."""
         self.ecommerce.add_user("user3", "Charlie", 500.0)
         self.assertIn("user3", self.ecommerce._users)
-        self.assertEqual(self.ecommerce._users["user3"]["name"], "Charlie")
-        self.assertEqual(self.ecommerce._users["user3"]["balance"], 500.0)
+        self.assertEqual(self.ecommerce._users["user3"].name, "Charlie")
+        self.assertEqual(self.ecommerce._users["user3"].balance_cents, 50000)
 
     def test_add_user_negative_balance(self):
         """Test that adding a user with a negative initial balance raises ValueError."""
@@ -50,13 +73,13 @@ class TestEcommerce(unittest.TestCase):
         self.ecommerce.add_to_cart("user1", "prod1")
         self.assertIn("user1", self.ecommerce._carts)
         self.assertIn("prod1", self.ecommerce._carts["user1"])
-        self.assertEqual(self.ecommerce._carts["user1"]["prod1"], 1)
+        self.assertEqual(self.ecommerce._carts["user1"]["prod1"]["quantity"], 1)
 
     def test_add_to_cart_increase_quantity(self):
         """Test adding an item that's already in the cart increases its quantity."""
         self.ecommerce.add_to_cart("user1", "prod1", 2)
         self.ecommerce.add_to_cart("user1", "prod1", 3)
-        self.assertEqual(self.ecommerce._carts["user1"]["prod1"], 5)
+        self.assertEqual(self.ecommerce._carts["user1"]["prod1"]["quantity"], 5)
 
     def test_add_to_cart_invalid_user(self):
         """Test adding to cart for a non-existent user raises UserNotFoundError."""
@@ -82,7 +105,7 @@ class TestEcommerce(unittest.TestCase):
         """Test removing a quantity that is less than the total in the cart."""
         self.ecommerce.add_to_cart("user1", "prod1", 5)
         self.ecommerce.remove_from_cart("user1", "prod1", 2)
-        self.assertEqual(self.ecommerce._carts["user1"]["prod1"], 3)
+        self.assertEqual(self.ecommerce._carts["user1"]["prod1"]["quantity"], 3)
 
     def test_remove_from_cart_exact_quantity(self):
         """Test removing the exact quantity of an item, removing it from the cart."""
@@ -103,7 +126,7 @@ class TestEcommerce(unittest.TestCase):
         self.ecommerce.add_to_cart("user1", "prod1")
         # Attempt to remove a different product
         self.ecommerce.remove_from_cart("user1", "prod2")
-        self.assertEqual(self.ecommerce._carts["user1"]["prod1"], 1)
+        self.assertEqual(self.ecommerce._carts["user1"]["prod1"]["quantity"], 1)
 
     def test_remove_from_cart_cleanup_empty_cart(self):
         """Test that the user's cart is removed entirely when the last item is removed."""
@@ -145,6 +168,30 @@ class TestEcommerce(unittest.TestCase):
         self.assertEqual(laptop_item["quantity"], 1)
         self.assertAlmostEqual(laptop_item["subtotal"], 80.0)
 
+    def test_get_cart_total_tracks_cart_changes(self):
+        """Test the cached cart total follows adds, removes, and checkout."""
+        self.assertEqual(self.ecommerce.get_cart_total("user1"), 0.0)
+        self.ecommerce.add_to_cart("user1", "prod2", 3)  # 45.0
+        self.assertAlmostEqual(self.ecommerce.get_cart_total("user1"), 45.0)
+        self.ecommerce.remove_from_cart("user1", "prod2", 5)
+        self.assertEqual(self.ecommerce.get_cart_total("user1"), 0.0)
+        self.ecommerce.add_to_cart("user1", "prod2", 2)  # 30.0
+        self.assertAlmostEqual(self.ecommerce.get_cart_total("user1"), 30.0)
+        self.ecommerce.checkout("user1")
+        self.assertEqual(self.ecommerce.get_cart_total("user1"), 0.0)
+
+    def test_versions_change_on_mutation(self):
+        """Test the cart and order versions only move when the data changes."""
+        self.assertEqual(self.ecommerce.get_cart_version("user1"), 0)
+        self.ecommerce.add_to_cart("user1", "prod2")
+        cart_version = self.ecommerce.get_cart_version("user1")
+        self.assertGreater(cart_version, 0)
+        self.ecommerce.remove_from_cart("user1", "prod1")  # Not in cart: no change
+        self.assertEqual(self.ecommerce.get_cart_version("user1"), cart_version)
+        self.ecommerce.checkout("user1")
+        self.assertGreater(self.ecommerce.get_cart_version("user1"), cart_version)
+        self.assertEqual(self.ecommerce.get_orders_version("user1"), 1)
+
     def test_view_cart_invalid_user(self):
         """Test viewing cart for a non-existent user raises UserNotFoundError."""
         with self.assertRaises(UserNotFoundError):
@@ -157,7 +204,7 @@ class TestEcommerce(unittest.TestCase):
         self.ecommerce.add_to_cart("user1", "prod2", 1) # 15.0
         # Total: 95.0, Balance: 100.0
         
-        initial_balance = self.ecommerce._users["user1"]["balance"]
+        initial_balance_cents = self.ecommerce._users["user1"].balance_cents
         cart_total = self.ecommerce.view_cart("user1")["total_value"]
         
         order_id = self.ecommerce.checkout("user1")
@@ -170,7 +217,9 @@ class TestEcommerce(unittest.TestCase):
             self.fail("Checkout did not return a valid UUID string.")
 
         # Check balance deduction
-        self.assertAlmostEqual(self.ecommerce._users["user1"]["balance"], initial_balance - cart_total)
+        self.assertEqual(
+            self.ecommerce._users["user1"].balance_cents, initial_balance_cents - round(cart_total * 100)
+        )
         
         # Check cart is cleared
         self.assertNotIn("user1", self.ecommerce._carts)
@@ -182,6 +231,14 @@ class TestEcommerce(unittest.TestCase):
         self.assertAlmostEqual(orders[0]["total_value"], 95.0)
         self.assertEqual(orders[0]["items"], {"prod1": 1, "prod2": 1})
 
+    def test_checkout_exact_balance_no_float_drift(self):
+        """Test that a balance exactly covering the cart is accepted despite float inputs."""
+        self.ecommerce.add_user("user3", "Charlie", 0.3)
+        self.ecommerce.add_product("prod3", "Sticker", 0.1)
+        self.ecommerce.add_to_cart("user3", "prod3", 3)
+        self.ecommerce.checkout("user3")
+        self.assertEqual(self.ecommerce._users["user3"].balance_cents, 0)
+
     def test_checkout_empty_cart(self):
         """Test checkout with an empty cart raises EmptyCartError."""
         with self.assertRaises(EmptyCartError):
@@ -216,8 +273,8 @@ class TestEcommerce(unittest.TestCase):
         
         history = self.ecommerce.get_order_history("user1")
         self.assertEqual(len(history), 2)
-        self.assertEqual(history[0]["order_id"], order_id1)
-        self.assertEqual(history[1]["order_id"], order_id2)
+        self.assertEqual(history[0]["order_id"], order_id2)
+        self.assertEqual(history[1]["order_id"], order_id1)
 
     def test_get_order_history_invalid_user(self):
         """Test getting order history for a non-existent user raises UserNotFoundError."""
@@ -7,6 +7,13 @@ quiz_engine = Quiz()
 # We'll use a single "player" for this simple UI: "Player1"
 PLAYER_NAME = "Player1"
 
+# Radio choices ("1", "2", ...) for the usual option counts, built once
+OPTION_CHOICES_BY_LEN = {n: [str(i+1) for i in range(n)] for n in range(2, 9)}
+
+def option_choices(num_options):
+    choices = OPTION_CHOICES_BY_LEN.get(num_options)
+    return choices if choices is not None else [str(i+1) for i in range(num_options)]
+
 # --- Backend Helper Functions for Gradio UI ---
 
 def admin_add_question(question_text, option1, option2, option3, option4, correct_option_index_str):
@@ -54,8 +61,7 @@ def admin_add_question(question_text, option1, option2, option3, option4, correc
              return "Error: Correct option index must be between 1 and 4.", None
              
         question_id = quiz_engine.add_question(question_text, final_options, correct_option_index)
-        all_questions = quiz_engine.get_all_questions()
-        questions_str = "\n".join([f"ID: {q['id']}, Q: {q['question_text']}, Options: {q['options']}, Correct: {q['correct_option_index']+1}" for q in all_questions])
+        questions_str = quiz_engine.get_all_display_strings()
         return f"Question added! ID: {question_id}\n\nCurrent Questions:\n{questions_str}", None
     except ValueError as e:
         return f"Error: {e}", None
@@ -65,18 +71,16 @@ def admin_add_question(question_text, option1, option2, option3, option4, correc
 def admin_delete_question(question_id):
     success = quiz_engine.delete_question(question_id)
     if success:
-        all_questions = quiz_engine.get_all_questions()
-        questions_str = "\n".join([f"ID: {q['id']}, Q: {q['question_text']}, Options: {q['options']}, Correct: {q['correct_option_index']+1}" for q in all_questions])
+        questions_str = quiz_engine.get_all_display_strings()
         return f"Question ID {question_id} deleted.\n\nCurrent Questions:\n{questions_str}", None
     else:
         return f"Question ID {question_id} not found.", None
 
 def get_all_questions_for_display():
-    questions = quiz_engine.get_all_questions()
-    if not questions:
+    questions_str = quiz_engine.get_all_display_strings()
+    if not questions_str:
         return "No questions created yet.", ""
     
-    questions_str = "\n".join([f"ID: {q['id']}, Q: {q['question_text']}, Options: {q['options']}, Correct: {q['correct_option_index']+1}" for q in questions])
     return "All Questions (for Admin):\n" + questions_str, ""
 
 def start_player_quiz(num_questions_str):
@@ -87,11 +91,10 @@ def start_player_quiz(num_questions_str):
 
     first_question = quiz_engine.start_quiz(PLAYER_NAME, num_questions)
     if first_question:
-        gr.State(first_question['id']) # Store current question ID in state
-        options_text = "\n".join([f"{i+1}. {opt}" for i, opt in enumerate(first_question['options'])])
+        options_text = first_question['options_display']
         return (f"Quiz Started for {PLAYER_NAME}!\n\nQuestion:\n{first_question['question_text']}\n\nOptions:\n{options_text}",
                 first_question['id'], # For hidden question ID
-                gr.update(choices=[str(i+1) for i in range(len(first_question['options']))], value=None, visible=True),
+                gr.update(choices=option_choices(len(first_question['options'])), value=None, visible=True),
                 gr.update(visible=True), # Show submit button
                 gr.update(visible=True)) # Show end quiz button
     else:
@@ -110,10 +113,10 @@ def submit_player_answer(question_id_state, chosen_option_index_str):
         next_question_data = quiz_engine.get_next_question_for_player(PLAYER_NAME)
 
         if next_question_data:
-            options_text = "\n".join([f"{i+1}. {opt}" for i, opt in enumerate(next_question_data['options'])])
+            options_text = next_question_data['options_display']
             return (f"{feedback}\n\nNext Question:\n{next_question_data['question_text']}\n\nOptions:\n{options_text}",
                     next_question_data['id'],
-                    gr.update(choices=[str(i+1) for i in range(len(next_question_data['options']))], value=None, visible=True),
+                    gr.update(choices=option_choices(len(next_question_data['options'])), value=None, visible=True),
                     gr.update(visible=True), gr.update(visible=True))
         else:
             # Quiz completed
@@ -146,14 +149,10 @@ def end_player_quiz():
         return "No active quiz to end.", None, gr.update(visible=False), gr.update(visible=False), gr.update(visible=False)
 
 def get_player_history():
-    history = quiz_engine.get_player_score_history(PLAYER_NAME)
-    if not history:
+    history_str = quiz_engine.get_player_score_history_str(PLAYER_NAME)
+    if not history_str:
         return f"No score history for {PLAYER_NAME} yet.", None
     
-    history_str = "\n".join([
-        f"Attempt ID: {s['attempt_id']}, Score: {s['score']}/{s['total_questions']}, Start: {s['start_time']}, End: {s['end_time']}, Completed: {s['is_completed']}"
-        for s in history
-    ])
     return f"Score History for {PLAYER_NAME}:\n{history_str}", None
 
 def view_attempt_details(attempt_id):
@@ -305,9 +304,11 @@ with gr.Blocks(title="Simple Quiz Game") as demo:
 
 if __name__ == "__main__":
     # Pre-populate some questions for testing
-    quiz_engine.add_question("What is the capital of France?", ["Berlin", "Madrid", "Paris", "Rome"], 2) # Paris
-    quiz_engine.add_question("Which planet is known as the Red Planet?", ["Earth", "Mars", "Jupiter", "Venus"], 1) # Mars
-    quiz_engine.add_question("What is 2 + 2?", ["3", "4", "5", "6"], 1) # 4
-    quiz_engine.add_question("What is the largest ocean on Earth?", ["Atlantic", "Indian", "Arctic", "Pacific"], 3) # Pacific
+    quiz_engine.add_questions([
+        ("What is the capital of France?", ["Berlin", "Madrid", "Paris", "Rome"], 2), # Paris
+        ("Which planet is known as the Red Planet?", ["Earth", "Mars", "Jupiter", "Venus"], 1), # Mars
+        ("What is 2 + 2?", ["3", "4", "5", "6"], 1), # 4
+        ("What is the largest ocean on Earth?", ["Atlantic", "Indian", "Arctic", "Pacific"], 3), # Pacific
+    ])
 
     demo.launch()
\ No newline at end of file
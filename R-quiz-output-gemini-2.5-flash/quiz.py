@@ -1,202 +1,322 @@
 import uuid
 from datetime import datetime
 import random
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Iterable, Mapping, Optional, Tuple
+
+_now = datetime.now
+
+def _new_id() -> str:
+    return uuid.uuid4().hex
 
 # Internal Helper Classes
 
 class Question:
-    def __init__(self, question_text: str, options: List[str], correct_option_index: int):
+    __slots__ = ('id', 'question_text', 'options', 'correct_option_index',
+                 '_dict', '_player_dict', 'view', 'display_str', 'options_display')
+
+    def __init__(self, question_text: str, options: List[str], correct_option_index: int,
+                 *, id_factory: Callable[[], str] = _new_id):
         if not (0 <= correct_option_index < len(options)):
             raise ValueError("correct_option_index is out of bounds for the provided options.")
 
-        self.id = str(uuid.uuid4())
+        self.id = id_factory()
         self.question_text = question_text
-        self.options = list(options) # Ensure a copy is stored
+        # Stored as a tuple: a copy the caller can't affect, safe to share from the cached views
+        self.options = tuple(options)
         self.correct_option_index = correct_option_index
-
-    def is_correct(self, chosen_index: int) -> bool:
-        return chosen_index == self.correct_option_index
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+        # Fields never change after construction, so both views are built once;
+        # to_dict/to_player_dict hand out copies, and `view` is a shared read-only proxy
+        self._dict: Dict[str, Any] = {
             'id': self.id,
             'question_text': self.question_text,
             'options': self.options,
             'correct_option_index': self.correct_option_index
         }
-
-    def to_player_dict(self) -> Dict[str, Any]:
-        return {
+        self.view: Mapping[str, Any] = MappingProxyType(self._dict)
+        self.options_display = "\n".join(f"{i+1}. {opt}" for i, opt in enumerate(self.options))
+        self._player_dict: Dict[str, Any] = {
             'id': self.id,
             'question_text': self.question_text,
-            'options': self.options
+            'options': self.options,
+            'options_display': self.options_display
         }
+        self.display_str = f"ID: {self.id}, Q: {question_text}, Options: {list(self.options)}, Correct: {correct_option_index+1}"
+
+    def is_correct(self, chosen_index: int) -> bool:
+        return chosen_index == self.correct_option_index
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._dict)
+
+    def to_player_dict(self) -> Dict[str, Any]:
+        return dict(self._player_dict)
 
 class QuizAttempt:
-    def __init__(self, player_name: str, questions: List[Question]):
+    __slots__ = ('attempt_id', 'player_name', '_questions_for_attempt',
+                 'correct_answers_count', 'current_question_idx', 'is_completed',
+                 'start_time', 'end_time', 'start_time_iso', 'end_time_iso',
+                 'history_row', '_history_entry', '_summary', 'question_results', '_total')
+
+    def __init__(self, player_name: str, questions: List[Question],
+                 *, id_factory: Callable[[], str] = _new_id):
         if not questions:
             raise ValueError("A quiz attempt must have at least one question.")
 
-        self.attempt_id = str(uuid.uuid4())
+        self.attempt_id = id_factory()
         self.player_name = player_name
         self._questions_for_attempt = list(questions) # Store a copy
-        self.answers_given: List[Optional[int]] = [None] * len(questions)
+        self._total = total = len(questions)
         self.correct_answers_count = 0
         self.current_question_idx = 0
         self.is_completed = False
-        self.start_time = datetime.now()
+        self.start_time = _now()
         self.end_time: Optional[datetime] = None
-        self.question_results: List[Dict[str, Any]] = []
+        # ISO strings are formatted once and reused by every summary/history read
+        self.start_time_iso = self.start_time.isoformat()
+        self.end_time_iso: Optional[str] = None
+        self.history_row: Optional[str] = None
+        self._history_entry: Optional[Mapping[str, Any]] = None
+        self._summary: Optional[Mapping[str, Any]] = None
+        # (question_idx, chosen_option_index, is_correct) per slot, written by index as answers
+        # arrive; only the first current_question_idx slots are filled
+        self.question_results: List[Optional[Tuple[int, int, bool]]] = [None] * total
+
+    @property
+    def answers_given(self) -> List[Optional[int]]:
+        # Rebuilt on demand from question_results; unanswered questions stay None
+        answers: List[Optional[int]] = [None] * self._total
+        for question_idx, chosen_option_index, _ in self.question_results[:self.current_question_idx]:
+            answers[question_idx] = chosen_option_index
+        return answers
 
     def get_current_question_for_player(self) -> Optional[Dict[str, Any]]:
-        if self.is_completed or self.current_question_idx >= len(self._questions_for_attempt):
+        if self.is_completed or self.current_question_idx >= self._total:
             return None
         current_q = self._questions_for_attempt[self.current_question_idx]
-        player_dict = current_q.to_player_dict()
-        player_dict['attempt_id'] = self.attempt_id # Add attempt_id to player view
-        return player_dict
+        # Copy the prebuilt player view while adding attempt_id to it
+        return {**current_q._player_dict, 'attempt_id': self.attempt_id}
 
     def submit_answer(self, question_id: str, chosen_option_index: int) -> bool:
         if self.is_completed:
             raise ValueError("Quiz is already completed.")
-        if self.current_question_idx >= len(self._questions_for_attempt):
+        questions = self._questions_for_attempt
+        idx = self.current_question_idx
+        if idx >= self._total:
             raise ValueError("No more questions in this quiz.")
 
-        current_question = self._questions_for_attempt[self.current_question_idx]
+        current_question = questions[idx]
         if question_id != current_question.id:
             raise ValueError(f"Question ID mismatch. Expected {current_question.id}, got {question_id}.")
 
         if not (0 <= chosen_option_index < len(current_question.options)):
             raise ValueError(f"Chosen option index {chosen_option_index} is out of bounds for question '{current_question.question_text}'.")
 
-        self.answers_given[self.current_question_idx] = chosen_option_index
-        is_correct = current_question.is_correct(chosen_option_index)
+        # Same check as Question.is_correct, inlined on the per-answer path
+        is_correct = chosen_option_index == current_question.correct_option_index
 
         if is_correct:
             self.correct_answers_count += 1
 
-        self.question_results.append({
-            'question_id': current_question.id,
-            'question_text': current_question.question_text,
-            'options': current_question.options,
-            'chosen_answer_index': chosen_option_index,
-            'correct_answer_index': current_question.correct_option_index,
-            'is_correct': is_correct
-        })
-
-        self.current_question_idx += 1
-        if self.current_question_idx >= len(self._questions_for_attempt):
-            self.is_completed = True
-            self.end_time = datetime.now()
+        self.question_results[idx] = (idx, chosen_option_index, is_correct)
+
+        idx += 1
+        self.current_question_idx = idx
+        if idx >= self._total:
+            self._finalize()
 
         return is_correct
 
-    def get_summary(self) -> Dict[str, Any]:
+    def _finalize(self) -> None:
+        # Marks the attempt completed and freezes its end time; later calls are no-ops
+        if self.end_time_iso is None:
+            self.is_completed = True
+            self.end_time = _now()
+            self.end_time_iso = self.end_time.isoformat()
+            self.history_row = (
+                f"Attempt ID: {self.attempt_id}, Score: {self.correct_answers_count}/{self._total}, "
+                f"Start: {self.start_time_iso}, End: {self.end_time_iso}, Completed: True"
+            )
+
+    def get_summary(self) -> Mapping[str, Any]:
         # If quiz is not completed but summary is requested (e.g., via end_quiz),
         # mark it as completed and set end_time if not already set.
-        if not self.is_completed: # Don't overwrite if already completed from submit_answer
-            self.is_completed = True
-        if self.end_time is None: # Only set end_time if not already set
-            self.end_time = datetime.now()
-
-        return {
-            'attempt_id': self.attempt_id,
-            'player_name': self.player_name,
-            'score': self.correct_answers_count,
-            'total_questions': len(self._questions_for_attempt),
-            'start_time': self.start_time.isoformat(),
-            'end_time': self.end_time.isoformat() if self.end_time else None,
-            'is_completed': self.is_completed,
-            'details': self.question_results
-        }
+        self._finalize()
+
+        # Like the history entry, the summary of a finalized attempt is built once and
+        # shared read-only; its details are a tuple of read-only views
+        if self._summary is None:
+            self._summary = MappingProxyType({
+                'attempt_id': self.attempt_id,
+                'player_name': self.player_name,
+                'score': self.correct_answers_count,
+                'total_questions': self._total,
+                'start_time': self.start_time_iso,
+                'end_time': self.end_time_iso,
+                'is_completed': self.is_completed,
+                'details': self._build_details()
+            })
+        return self._summary
+
+    def _build_details(self) -> Tuple[Mapping[str, Any], ...]:
+        questions = self._questions_for_attempt
+        details = []
+        for question_idx, chosen_option_index, is_correct in self.question_results[:self.current_question_idx]:
+            question = questions[question_idx]
+            details.append(MappingProxyType({
+                'question_id': question.id,
+                'question_text': question.question_text,
+                'options': question.options,
+                'chosen_answer_index': chosen_option_index,
+                'correct_answer_index': question.correct_option_index,
+                'is_correct': is_correct
+            }))
+        return tuple(details)
+
+    def get_score_history_entry(self) -> Mapping[str, Any]:
+        # Ensure that the attempt is marked as completed and end_time is set for history display.
+        # If for some reason this is called on an active quiz, it will behave as if ended.
+        self._finalize()
+
+        # A finalized attempt never changes, so its entry is built once and shared as a read-only view
+        if self._history_entry is None:
+            self._history_entry = MappingProxyType({
+                'attempt_id': self.attempt_id,
+                'score': self.correct_answers_count,
+                'total_questions': self._total,
+                'start_time': self.start_time_iso,
+                'end_time': self.end_time_iso,
+                'is_completed': self.is_completed
+            })
+        return self._history_entry
+
+class PlayerState:
+    # Everything tracked per player, so each operation needs a single lookup by name
+    __slots__ = ('active', 'history', 'history_entries')
 
-    def get_score_history_entry(self) -> Dict[str, Any]:
-        # Ensure that the attempt is marked as completed and end_time is set for history display
-        # This state manipulation should ideally be done consistently on quiz completion
-        # For history display, we ensure the data reflects a completed state
-        if not self.is_completed:
-            # If for some reason this is called on an active quiz, it will behave as if ended
-            self.is_completed = True
-        if self.end_time is None:
-            self.end_time = datetime.now()
-
-        return {
-            'attempt_id': self.attempt_id,
-            'score': self.correct_answers_count,
-            'total_questions': len(self._questions_for_attempt),
-            'start_time': self.start_time.isoformat(),
-            'end_time': self.end_time.isoformat() if self.end_time else None,
-            'is_completed': self.is_completed
-        }
+    def __init__(self):
+        self.active: Optional[QuizAttempt] = None
+        self.history: List[QuizAttempt] = []
+        # Cached get_player_score_history result, cleared whenever history grows
+        self.history_entries: Optional[Tuple[Mapping[str, Any], ...]] = None
 
 # Main Class: Quiz
 
 class Quiz:
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None, id_factory: Optional[Callable[[], str]] = None):
+        # Source of randomness for question selection; pass a seeded Random for reproducible quizzes
+        self._rng = rng if rng is not None else random.Random()
+        # Generates question and attempt ids; pass a deterministic factory for stable ids in tests
+        self._id_factory = id_factory if id_factory is not None else _new_id
         self._questions: Dict[str, Question] = {}
-        self._active_quizzes: Dict[str, QuizAttempt] = {}
-        self._player_scores_history: Dict[str, List[QuizAttempt]] = {}
+        # Parallel id list (with positions) so start_quiz can sample without copying the bank
+        self._question_ids: List[str] = []
+        self._id_to_pos: Dict[str, int] = {}
+        self._players: Dict[str, PlayerState] = {}
+        # Read caches, rebuilt lazily after the question bank changes: read-only
+        # question views (safe to share between callers) and the joined admin listing
+        self._all_questions_cache: Optional[Tuple[Mapping[str, Any], ...]] = None
+        self._all_display_cache: Optional[str] = None
+        # Finished attempts indexed by attempt_id for direct detail lookups
+        self._attempts_by_id: Dict[str, QuizAttempt] = {}
 
     # Admin Functions
 
     def add_question(self, question_text: str, options: List[str], correct_option_index: int) -> str:
-        new_question = Question(question_text, options, correct_option_index)
+        new_question = Question(question_text, options, correct_option_index, id_factory=self._id_factory)
         self._questions[new_question.id] = new_question
+        self._append_question_id(new_question.id)
+        self._all_questions_cache = None
+        self._all_display_cache = None
         return new_question.id
 
-    def get_all_questions(self) -> List[Dict[str, Any]]:
-        return [q.to_dict() for q in self._questions.values()]
+    def add_questions(self, specs: Iterable[Tuple[str, List[str], int]]) -> List[str]:
+        # All questions are validated before any is stored, and the caches are cleared once
+        new_questions = [
+            Question(question_text, options, correct_option_index, id_factory=self._id_factory)
+            for question_text, options, correct_option_index in specs
+        ]
+        for question in new_questions:
+            self._questions[question.id] = question
+            self._append_question_id(question.id)
+        if new_questions:
+            self._all_questions_cache = None
+            self._all_display_cache = None
+        return [question.id for question in new_questions]
+
+    def get_all_questions(self) -> Tuple[Mapping[str, Any], ...]:
+        # Read-only views of every question; use Question.to_dict for a mutable copy
+        if self._all_questions_cache is None:
+            self._all_questions_cache = tuple(q.view for q in self._questions.values())
+        return self._all_questions_cache
+
+    def get_all_display_strings(self) -> str:
+        # One line per question, joined; empty string when there are no questions
+        if self._all_display_cache is None:
+            self._all_display_cache = "\n".join(q.display_str for q in self._questions.values())
+        return self._all_display_cache
 
     def delete_question(self, question_id: str) -> bool:
         if question_id in self._questions:
             del self._questions[question_id]
+            # Swap the last id into the freed slot so removal stays O(1)
+            pos = self._id_to_pos.pop(question_id)
+            last_id = self._question_ids.pop()
+            if last_id != question_id:
+                self._question_ids[pos] = last_id
+                self._id_to_pos[last_id] = pos
+            self._all_questions_cache = None
+            self._all_display_cache = None
             return True
         return False
 
+    def _append_question_id(self, question_id: str) -> None:
+        self._id_to_pos[question_id] = len(self._question_ids)
+        self._question_ids.append(question_id)
+
     # Player Functions
 
     def start_quiz(self, player_name: str, num_questions: Optional[int] = None) -> Optional[Dict[str, Any]]:
-        available_questions = list(self._questions.values())
-        if not available_questions:
+        question_ids = self._question_ids
+        if not question_ids:
             return None
 
-        random.shuffle(available_questions)
-
-        if num_questions is None or num_questions > len(available_questions):
-            selected_questions = available_questions
+        # Sampling picks only the questions we need instead of shuffling the whole bank
+        if num_questions is None or num_questions > len(question_ids):
+            k = len(question_ids)
         else:
-            selected_questions = available_questions[:num_questions]
+            k = max(num_questions, 0)
+        questions = self._questions
+        selected_questions = [questions[qid] for qid in self._rng.sample(question_ids, k)]
 
         if not selected_questions: # Should not happen if available_questions is not empty after filtering
             return None
 
-        # If a quiz is already active, end it and move to history
-        if player_name in self._active_quizzes:
+        # If a quiz is already active, end it and move to history; an attempt with
+        # no answers yet is simply dropped so it doesn't clutter the history
+        state = self._players.get(player_name)
+        if state is None:
+            state = self._players[player_name] = PlayerState()
+        old_attempt = state.active
+        if old_attempt is not None and old_attempt.current_question_idx > 0:
             self.end_quiz(player_name) # This will store the old quiz in history
 
-        new_attempt = QuizAttempt(player_name, selected_questions)
-        self._active_quizzes[player_name] = new_attempt
+        new_attempt = QuizAttempt(player_name, selected_questions, id_factory=self._id_factory)
+        state.active = new_attempt
 
-        # Return the first question
-        first_question = new_attempt.get_current_question_for_player()
-        if first_question:
-            # Ensure attempt_id is included as per design for the return value
-            first_question['attempt_id'] = new_attempt.attempt_id
-        return first_question
+        # Return the first question; the player view already carries attempt_id
+        return new_attempt.get_current_question_for_player()
 
 
     def get_current_quiz_state(self, player_name: str) -> Optional[Dict[str, Any]]:
-        active_attempt = self._active_quizzes.get(player_name)
+        active_attempt = self._get_active(player_name)
         if not active_attempt:
             return None
-        current_q_data = active_attempt.get_current_question_for_player()
-        if current_q_data:
-            current_q_data['attempt_id'] = active_attempt.attempt_id # Ensure attempt_id is present
-        return current_q_data
+        return active_attempt.get_current_question_for_player()
 
     def submit_answer(self, player_name: str, question_id: str, chosen_option_index: int) -> bool:
-        active_attempt = self._active_quizzes.get(player_name)
+        state = self._players.get(player_name)
+        active_attempt = state.active if state is not None else None
         if not active_attempt:
             raise ValueError(f"No active quiz for player '{player_name}'.")
 
@@ -204,42 +324,62 @@ class Quiz:
 
         # If quiz is completed after submitting this answer, move it to history
         if active_attempt.is_completed:
-            self._player_scores_history.setdefault(player_name, []).append(active_attempt)
-            del self._active_quizzes[player_name]
+            state.active = None
+            self._persist_attempt(state, active_attempt)
 
         return is_correct
 
     def get_next_question_for_player(self, player_name: str) -> Optional[Dict[str, Any]]:
-        active_attempt = self._active_quizzes.get(player_name)
+        active_attempt = self._get_active(player_name)
         if not active_attempt:
             return None # No active quiz or quiz ended
 
-        next_q_data = active_attempt.get_current_question_for_player()
-        if next_q_data:
-            next_q_data['attempt_id'] = active_attempt.attempt_id
-        return next_q_data
+        return active_attempt.get_current_question_for_player()
 
-    def end_quiz(self, player_name: str) -> Optional[Dict[str, Any]]:
-        active_attempt = self._active_quizzes.get(player_name)
-        if not active_attempt:
+    def end_quiz(self, player_name: str) -> Optional[Mapping[str, Any]]:
+        state = self._players.get(player_name)
+        if state is None or state.active is None:
             return None
+        active_attempt = state.active
+        state.active = None
 
         # The get_summary method of QuizAttempt handles marking it as completed and setting end_time
         summary = active_attempt.get_summary()
 
-        self._player_scores_history.setdefault(player_name, []).append(active_attempt)
-        del self._active_quizzes[player_name]
+        self._persist_attempt(state, active_attempt)
         return summary
 
-    def get_player_score_history(self, player_name: str) -> List[Dict[str, Any]]:
-        history = self._player_scores_history.get(player_name, [])
-        # Call get_score_history_entry on each attempt to ensure consistent data and handling of completion status
-        return [attempt.get_score_history_entry() for attempt in history]
-
-    def get_player_last_attempt_details(self, player_name: str, attempt_id: str) -> Optional[Dict[str, Any]]:
-        history = self._player_scores_history.get(player_name, [])
-        for attempt in history:
-            if attempt.attempt_id == attempt_id:
-                # Call get_summary on the specific attempt to ensure consistent data and handling of completion status
-                return attempt.get_summary()
-        return None
\ No newline at end of file
+    def _get_active(self, player_name: str) -> Optional[QuizAttempt]:
+        state = self._players.get(player_name)
+        return state.active if state is not None else None
+
+    def _persist_attempt(self, state: PlayerState, attempt: QuizAttempt) -> None:
+        # Single place where finished attempts are recorded; a storage backend
+        # would hook in here (and could batch its writes) without touching callers
+        state.history.append(attempt)
+        state.history_entries = None
+        self._attempts_by_id[attempt.attempt_id] = attempt
+
+    def get_player_score_history(self, player_name: str) -> Tuple[Mapping[str, Any], ...]:
+        # A tuple of read-only entries, so callers can share it without altering the stored history
+        state = self._players.get(player_name)
+        if state is None:
+            return ()
+        if state.history_entries is None:
+            # Call get_score_history_entry on each attempt to ensure consistent data and handling of completion status
+            state.history_entries = tuple(attempt.get_score_history_entry() for attempt in state.history)
+        return state.history_entries
+
+    def get_player_score_history_str(self, player_name: str) -> str:
+        # Finished attempts carry a preformatted row, so this is a single join
+        state = self._players.get(player_name)
+        if state is None:
+            return ""
+        return "\n".join(attempt.history_row for attempt in state.history)
+
+    def get_player_last_attempt_details(self, player_name: str, attempt_id: str) -> Optional[Mapping[str, Any]]:
+        attempt = self._attempts_by_id.get(attempt_id)
+        if attempt is None or attempt.player_name != player_name:
+            return None
+        # Call get_summary on the specific attempt to ensure consistent data and handling of completion status
+        return attempt.get_summary()
\ No newline at end of file
@@ -0,0 +1,164 @@
+import itertools
+import random
+import unittest
+
+from quiz import Quiz
+
+
+def make_quiz(seed=0):
+    # Seeded question selection and sequential ids make every run identical
+    counter = itertools.count()
+    return Quiz(rng=random.Random(seed), id_factory=lambda: f"id-{next(counter)}")
+
+
+class TestQuizEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.quiz = make_quiz()
+        self.question_ids = self.quiz.add_questions([
+            ("What is 2 + 2?", ["3", "4", "5"], 1),
+            ("Capital of France?", ["Paris", "Rome"], 0),
+            ("Largest planet?", ["Mars", "Venus", "Jupiter"], 2),
+        ])
+        self.correct = {"id-0": 1, "id-1": 0, "id-2": 2}
+
+    def answer_all(self, player, first, correct=True):
+        question = first
+        while question is not None:
+            index = self.correct[question['id']] if correct else (self.correct[question['id']] + 1) % len(question['options'])
+            self.quiz.submit_answer(player, question['id'], index)
+            question = self.quiz.get_next_question_for_player(player)
+
+    def test_ids_come_from_the_factory(self):
+        self.assertEqual(self.question_ids, ["id-0", "id-1", "id-2"])
+
+    def test_start_quiz_is_reproducible_with_a_seeded_rng(self):
+        first = self.quiz.start_quiz("alice", num_questions=2)
+        other = make_quiz()
+        other.add_questions([
+            ("What is 2 + 2?", ["3", "4", "5"], 1),
+            ("Capital of France?", ["Paris", "Rome"], 0),
+            ("Largest planet?", ["Mars", "Venus", "Jupiter"], 2),
+        ])
+        self.assertEqual(other.start_quiz("alice", num_questions=2)['id'], first['id'])
+        self.assertEqual(first['attempt_id'], "id-3")
+        self.assertIn(first['id'], self.question_ids)
+        self.assertNotIn('correct_option_index', first)
+
+    def test_start_quiz_without_questions(self):
+        self.assertIsNone(make_quiz().start_quiz("alice"))
+
+    def test_start_quiz_caps_num_questions_at_bank_size(self):
+        question = self.quiz.start_quiz("alice", num_questions=10)
+        seen = []
+        while question is not None:
+            seen.append(question['id'])
+            self.quiz.submit_answer("alice", question['id'], self.correct[question['id']])
+            question = self.quiz.get_next_question_for_player("alice")
+        self.assertEqual(sorted(seen), self.question_ids)
+
+    def test_submit_answer_scores_and_completes(self):
+        first = self.quiz.start_quiz("alice")
+        self.answer_all("alice", first)
+        self.assertIsNone(self.quiz.get_current_quiz_state("alice"))
+        history = self.quiz.get_player_score_history("alice")
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]['score'], 3)
+        self.assertEqual(history[0]['total_questions'], 3)
+        self.assertTrue(history[0]['is_completed'])
+
+    def test_submit_answer_errors(self):
+        with self.assertRaises(ValueError):
+            self.quiz.submit_answer("alice", "id-0", 0)
+        first = self.quiz.start_quiz("alice")
+        with self.assertRaises(ValueError):
+            self.quiz.submit_answer("alice", "wrong-id", 0)
+        with self.assertRaises(ValueError):
+            self.quiz.submit_answer("alice", first['id'], 99)
+
+    def test_restart_drops_an_unanswered_attempt(self):
+        self.quiz.start_quiz("alice")
+        self.quiz.start_quiz("alice")
+        self.assertEqual(self.quiz.get_player_score_history("alice"), ())
+
+    def test_restart_archives_an_answered_attempt(self):
+        first = self.quiz.start_quiz("alice")
+        self.quiz.submit_answer("alice", first['id'], self.correct[first['id']])
+        self.quiz.start_quiz("alice")
+        history = self.quiz.get_player_score_history("alice")
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]['attempt_id'], first['attempt_id'])
+        self.assertEqual(history[0]['score'], 1)
+
+    def test_end_quiz_returns_summary(self):
+        first = self.quiz.start_quiz("alice")
+        self.quiz.submit_answer("alice", first['id'], self.correct[first['id']])
+        summary = self.quiz.end_quiz("alice")
+        self.assertEqual(summary['score'], 1)
+        self.assertEqual(len(summary['details']), 1)
+        self.assertTrue(summary['details'][0]['is_correct'])
+        self.assertIsNone(self.quiz.end_quiz("alice"))
+
+    def test_delete_question_swap_pop(self):
+        self.assertTrue(self.quiz.delete_question("id-0"))
+        self.assertFalse(self.quiz.delete_question("id-0"))
+        self.assertEqual([q['id'] for q in self.quiz.get_all_questions()], ["id-1", "id-2"])
+        self.assertEqual(self.quiz.get_all_display_strings().count("\n"), 1)
+        new_id = self.quiz.add_question("New?", ["a", "b"], 1)
+        self.assertEqual([q['id'] for q in self.quiz.get_all_questions()], ["id-1", "id-2", "id-3"])
+        self.assertEqual(new_id, "id-3")
+        self.correct[new_id] = 1
+        self.assertTrue(self.quiz.delete_question("id-3"))  # the last slot
+
+        question = self.quiz.start_quiz("alice")
+        seen = []
+        while question is not None:
+            seen.append(question['id'])
+            self.quiz.submit_answer("alice", question['id'], self.correct[question['id']])
+            question = self.quiz.get_next_question_for_player("alice")
+        self.assertEqual(sorted(seen), ["id-1", "id-2"])
+
+    def test_history_and_attempt_details(self):
+        first = self.quiz.start_quiz("alice")
+        self.answer_all("alice", first, correct=False)
+        self.assertEqual(len(self.quiz.get_player_score_history("alice")), 1)
+        second = self.quiz.start_quiz("alice")
+        self.answer_all("alice", second)
+
+        history = self.quiz.get_player_score_history("alice")
+        self.assertEqual([entry['score'] for entry in history], [0, 3])
+        self.assertEqual(len(self.quiz.get_player_score_history_str("alice").splitlines()), 2)
+
+        details = self.quiz.get_player_last_attempt_details("alice", first['attempt_id'])
+        self.assertEqual(details['score'], 0)
+        self.assertFalse(any(detail['is_correct'] for detail in details['details']))
+        self.assertIsNone(self.quiz.get_player_last_attempt_details("bob", first['attempt_id']))
+        self.assertEqual(self.quiz.get_player_score_history("bob"), ())
+
+    def test_returned_views_are_read_only(self):
+        questions = self.quiz.get_all_questions()
+        with self.assertRaises(TypeError):
+            questions[0]['question_text'] = "changed"
+        self.assertIs(self.quiz.get_all_questions(), questions)
+        self.assertEqual(questions[0]['question_text'], "What is 2 + 2?")
+
+        first = self.quiz.start_quiz("alice")
+        self.answer_all("alice", first)
+        history = self.quiz.get_player_score_history("alice")
+        self.assertIsInstance(history, tuple)
+        with self.assertRaises(TypeError):
+            history[0]['score'] = 99
+        self.assertIs(self.quiz.get_player_score_history("alice"), history)
+        self.assertEqual(history[0]['score'], 3)
+
+        details = self.quiz.get_player_last_attempt_details("alice", first['attempt_id'])
+        with self.assertRaises(TypeError):
+            details['score'] = 0
+        with self.assertRaises(TypeError):
+            details['details'][0]['is_correct'] = False
+        self.assertIsInstance(details['details'], tuple)
+        self.assertIs(self.quiz.get_player_last_attempt_details("alice", first['attempt_id']), details)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,9 @@
 import gradio as gr
 import datetime
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 # Import the backend class and models from the todo.py module
+import todo
 from todo import Todo, Task, Priority
 
 # --- 1. Backend Instance ---
@@ -11,48 +12,68 @@ from todo import Todo, Task, Priority
 # or a proper database backend.
 todo_manager = Todo()
 
+# Maps the UI priority labels to the backend enum.
+PRIORITY_MAP: Dict[str, Priority] = {"HIGH": Priority.HIGH, "MEDIUM": Priority.MEDIUM, "LOW": Priority.LOW}
+
 # --- 2. Helper Functions ---
 # These functions bridge the gap between the raw data from the backend class
 # and the format required by the Gradio UI components.
 
+# Rendered rows keyed by task id. A task's fields only change when it is completed,
+# so a row is reused until the task object or its completion date differs.
+_row_cache: Dict[int, Tuple[Task, Optional[datetime.date], List]] = {}
+
+def _task_row(task: Task) -> List:
+    """Returns the display row for a task, building it only when it has changed."""
+    cached = _row_cache.get(task.id)
+    if cached is not None and cached[0] is task and cached[1] == task.completion_date:
+        return cached[2]
+    row = [
+        task.id,
+        task.description,
+        task.priority.name,
+        task.deadline.isoformat() if task.deadline else "N/A",
+        "✔️" if task.is_completed else "❌",
+        task.creation_date.isoformat(),
+        task.completion_date.isoformat() if task.completion_date else "N/A"
+    ]
+    _row_cache[task.id] = (task, task.completion_date, row)
+    return row
+
 def format_tasks_for_display(tasks: List[Task]) -> List[List]:
     """Converts a list of Task objects into a list of lists for a Gradio DataFrame."""
-    if not tasks:
-        # Return a list with a placeholder if there are no tasks, to avoid an empty DataFrame display issue.
-        # However, Gradio handles empty lists well now, so an empty list is fine.
-        return []
-    
-    display_list = []
-    for task in tasks:
-        display_list.append([
-            task.id,
-            task.description,
-            task.priority.name,
-            task.deadline.isoformat() if task.deadline else "N/A",
-            "✔️" if task.is_completed else "❌",
-            task.creation_date.isoformat(),
-            task.completion_date.isoformat() if task.completion_date else "N/A"
-        ])
-    return display_list
+    # Gradio handles empty lists well, so no placeholder row is needed.
+    return [_task_row(task) for task in tasks]
+
+# (backend version, date, outputs) of the last refresh; the date is part of the key
+# because the overdue list changes at midnight even without edits. It is read from the
+# backend's own clock so the cache rolls over exactly when the overdue list does.
+_last_updates: Optional[Tuple[int, datetime.date, Tuple]] = None
 
 def get_all_updates():
     """
     A single function to fetch all data from the backend and format it for the UI.
-    This is efficient as it updates all relevant components in one go.
+    This is efficient as it updates all relevant components in one go, and reuses
+    the previous result when nothing has changed since.
     """
-    pending_tasks = todo_manager.get_pending_tasks()
-    completed_tasks = todo_manager.get_completed_tasks()
-    overdue_tasks = todo_manager.get_overdue_tasks()
+    global _last_updates
+    version = todo_manager.get_version()
+    today = todo._today()
+    if _last_updates is not None and _last_updates[0] == version and _last_updates[1] == today:
+        return _last_updates[2]
+
+    pending_tasks, completed_tasks, overdue_tasks, percentage = todo_manager.get_dashboard_snapshot()
     
     pending_df_data = format_tasks_for_display(pending_tasks)
     completed_df_data = format_tasks_for_display(completed_tasks)
     overdue_df_data = format_tasks_for_display(overdue_tasks)
     
-    percentage = todo_manager.get_completion_percentage()
     percentage_str = f"Completion: {percentage:.2f}%"
     
     # The order of returned values must match the order of `outputs` in the click/load events.
-    return pending_df_data, completed_df_data, overdue_df_data, percentage_str
+    updates = (pending_df_data, completed_df_data, overdue_df_data, percentage_str)
+    _last_updates = (version, today, updates)
+    return updates
 
 # --- 3. UI Interaction Handlers ---
 # These functions are called when users interact with buttons in the UI.
@@ -65,8 +86,7 @@ def add_task_handler(description, priority_str, deadline_str):
         return get_all_updates() + (description, deadline_str) 
 
     # Convert priority string from UI to Priority enum for the backend
-    priority_map = {"HIGH": Priority.HIGH, "MEDIUM": Priority.MEDIUM, "LOW": Priority.LOW}
-    priority = priority_map.get(priority_str, Priority.MEDIUM)
+    priority = PRIORITY_MAP.get(priority_str, Priority.MEDIUM)
     
     # Convert deadline string to a date object, handling empty or invalid input
     deadline = None
@@ -108,6 +128,7 @@ def delete_task_handler(task_id):
 
     task_id = int(task_id)
     if todo_manager.delete_task(task_id):
+        _row_cache.pop(task_id, None)
         gr.Info(f"Task {task_id} deleted.")
     else:
         gr.Error(f"Task with ID {task_id} not found.")
@@ -115,9 +136,15 @@ def delete_task_handler(task_id):
     # Refresh all data displays
     return get_all_updates()
 
+# Fixed pieces of the daily summary Markdown
+_HDR_CREATED = "### Tasks Created\n"
+_HDR_COMPLETED = "\n### Tasks Completed\n"
+_HDR_OVERDUE = "\n### Overdue Tasks (Snapshot for this day)\n"
+_NONE_LINE = "- None\n"
+
 def get_summary_handler(date_str):
     """Handles the 'Get Summary' button click."""
-    summary_date = datetime.date.today()
+    summary_date = todo._today()
     if date_str:
         try:
             summary_date = datetime.date.fromisoformat(date_str)
@@ -126,31 +153,30 @@ def get_summary_handler(date_str):
 
     summary = todo_manager.get_daily_summary(summary_date)
     
-    # Format the summary dictionary into a readable Markdown string
-    md = f"## Daily Summary for {summary['date'].isoformat()}\n\n"
-    
-    md += "### Tasks Created\n"
+    # Format the summary dictionary into a readable Markdown string, collecting
+    # the pieces in a list and joining once instead of concatenating repeatedly
+    parts = [f"## Daily Summary for {summary['date'].isoformat()}\n\n", _HDR_CREATED]
     if summary['tasks_created']:
-        for task in summary['tasks_created']:
-            md += f"- (ID: {task.id}) {task.description}\n"
+        parts.extend(f"- (ID: {task.id}) {task.description}\n" for task in summary['tasks_created'])
     else:
-        md += "- None\n"
+        parts.append(_NONE_LINE)
         
-    md += "\n### Tasks Completed\n"
+    parts.append(_HDR_COMPLETED)
     if summary['tasks_completed']:
-        for task in summary['tasks_completed']:
-            md += f"- (ID: {task.id}) {task.description}\n"
+        parts.extend(f"- (ID: {task.id}) {task.description}\n" for task in summary['tasks_completed'])
     else:
-        md += "- None\n"
+        parts.append(_NONE_LINE)
         
-    md += "\n### Overdue Tasks (Snapshot for this day)\n"
+    parts.append(_HDR_OVERDUE)
     if summary['overdue_tasks_snapshot']:
-        for task in summary['overdue_tasks_snapshot']:
-            md += f"- (ID: {task.id}) {task.description} (Deadline: {task.deadline})\n"
+        parts.extend(
+            f"- (ID: {task.id}) {task.description} (Deadline: {task.deadline})\n"
+            for task in summary['overdue_tasks_snapshot']
+        )
     else:
-        md += "- None\n"
+        parts.append(_NONE_LINE)
         
-    return md
+    return "".join(parts)
 
 # --- 4. Gradio UI Layout ---
 
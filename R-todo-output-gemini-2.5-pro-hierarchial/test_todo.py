@@ -0,0 +1,162 @@
+import dataclasses
+import datetime
+import random
+import unittest
+from unittest import mock
+
+import todo
+from todo import Priority, Todo
+
+
+def ids(tasks):
+    return [task.id for task in tasks]
+
+
+class FakeDateMixin:
+    """Lets a test move the module's notion of "today"."""
+
+    def set_today(self, day):
+        class FakeDate(datetime.date):
+            @classmethod
+            def today(cls):
+                return day
+
+        patcher = mock.patch.object(todo.datetime, "date", FakeDate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        todo._today_cache = (0.0, datetime.date.min)
+        self.addCleanup(setattr, todo, "_today_cache", (0.0, datetime.date.min))
+
+
+class TestTodoIndexes(FakeDateMixin, unittest.TestCase):
+    """Checks every getter against brute-force filtering over all tasks."""
+
+    def assert_matches_brute_force(self, todo_list, today):
+        tasks = list(todo_list._tasks.values())
+        pending = sorted(
+            (t for t in tasks if not t.is_completed),
+            key=lambda t: (t.priority, t.deadline or datetime.date.max, t.id),
+        )
+        completed = sorted(
+            (t for t in tasks if t.is_completed),
+            key=lambda t: (-t.completion_date.toordinal(), t.id),
+        )
+        overdue = sorted(
+            (t for t in tasks if not t.is_completed and t.deadline and t.deadline < today),
+            key=lambda t: (t.deadline, t.id),
+        )
+        self.assertEqual(ids(todo_list.get_pending_tasks()), ids(pending))
+        self.assertEqual(ids(todo_list.get_completed_tasks()), ids(completed))
+        self.assertEqual(ids(todo_list.get_overdue_tasks()), ids(overdue))
+        expected_pct = len(completed) / len(tasks) * 100.0 if tasks else 0.0
+        self.assertAlmostEqual(todo_list.get_completion_percentage(), expected_pct)
+
+        snapshot = todo_list.get_dashboard_snapshot()
+        self.assertEqual([ids(part) for part in snapshot[:3]], [ids(pending), ids(completed), ids(overdue)])
+
+        for offset in range(-6, 3):
+            day = today + datetime.timedelta(days=offset)
+            summary = todo_list.get_daily_summary(day)
+            self.assertEqual(ids(summary["tasks_created"]), ids(t for t in tasks if t.creation_date == day))
+            self.assertEqual(ids(summary["tasks_completed"]), ids(t for t in tasks if t.completion_date == day))
+            self.assertEqual(
+                ids(summary["overdue_tasks_snapshot"]),
+                ids(
+                    t for t in tasks
+                    if (not t.is_completed or t.completion_date > day) and t.deadline and t.deadline < day
+                ),
+            )
+
+    def test_random_operations_match_brute_force(self):
+        rng = random.Random(0)
+        today = datetime.date(2024, 5, 15)
+        self.set_today(today)
+        todo_list = Todo()
+        for step in range(600):
+            roll = rng.random()
+            if roll < 0.5 or not todo_list._tasks:
+                deadline = rng.choice([None, today + datetime.timedelta(days=rng.randint(-5, 5))])
+                todo_list.add_task("task", Priority(rng.randint(1, 3)), deadline)
+            elif roll < 0.8:
+                self.set_today(today + datetime.timedelta(days=rng.randint(-3, 0)))
+                todo_list.complete_task(rng.choice(list(todo_list._tasks)))
+                self.set_today(today)
+            else:
+                todo_list.delete_task(rng.choice(list(todo_list._tasks) + [10**6]))
+            if step % 20 == 0:
+                self.assert_matches_brute_force(todo_list, today)
+        self.assert_matches_brute_force(todo_list, today)
+
+    def test_sort_fields_cannot_be_changed_in_place(self):
+        today = datetime.date(2024, 5, 15)
+        self.set_today(today)
+        todo_list = Todo()
+        first = todo_list.add_task("first", Priority.HIGH, today - datetime.timedelta(days=2))
+        second = todo_list.add_task("second", Priority.LOW, today - datetime.timedelta(days=1))
+        third = todo_list.add_task("third", Priority.MEDIUM)
+        done = todo_list.add_task("done", Priority.LOW)
+        todo_list.complete_task(done)
+
+        for field_name, value in (
+            ("priority", Priority.LOW),
+            ("deadline", today + datetime.timedelta(days=10)),
+            ("completion_date", today - datetime.timedelta(days=3)),
+        ):
+            with self.assertRaises(dataclasses.FrozenInstanceError):
+                setattr(todo_list.get_task(first), field_name, value)
+            with self.assertRaises(dataclasses.FrozenInstanceError):
+                setattr(todo_list.get_task(done), field_name, value)
+            # Getters right after the attempted edit still see the indexed order
+            self.assertEqual(ids(todo_list.get_pending_tasks()), [first, third, second])
+            self.assertEqual(ids(todo_list.get_completed_tasks()), [done])
+            self.assertEqual(ids(todo_list.get_overdue_tasks()), [first, second])
+        self.assert_matches_brute_force(todo_list, today)
+
+    def test_overdue_queries_after_attempted_deadline_edit(self):
+        today = datetime.date(2024, 5, 15)
+        self.set_today(today)
+        todo_list = Todo()
+        a = todo_list.add_task("a", Priority.HIGH, today - datetime.timedelta(days=5))
+        b = todo_list.add_task("b", Priority.LOW, today - datetime.timedelta(days=3))
+        c = todo_list.add_task("c", Priority.MEDIUM)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            todo_list.get_task(a).deadline = today + datetime.timedelta(days=10)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            todo_list.get_task(c).priority = Priority.HIGH
+
+        self.assertEqual(ids(todo_list.get_overdue_tasks()), [a, b])
+        self.assertEqual(ids(todo_list.get_daily_summary(today)["overdue_tasks_snapshot"]), [a, b])
+        self.assertEqual(
+            ids(todo_list.get_daily_summary(today - datetime.timedelta(days=4))["overdue_tasks_snapshot"]), [a]
+        )
+        self.assert_matches_brute_force(todo_list, today)
+
+    def test_complete_task_replaces_the_stored_task(self):
+        todo_list = Todo()
+        task_id = todo_list.add_task("task")
+        before = todo_list.get_task(task_id)
+        completed = todo_list.complete_task(task_id)
+        self.assertTrue(completed.is_completed)
+        self.assertFalse(before.is_completed)
+        self.assertIs(todo_list.get_task(task_id), completed)
+        self.assertEqual(ids(todo_list.get_daily_summary(completed.creation_date)["tasks_created"]), [task_id])
+        self.assertIs(todo_list.get_daily_summary(completed.creation_date)["tasks_created"][0], completed)
+        self.assertIsNone(todo_list.complete_task(999))
+
+    def test_version_changes_on_every_edit(self):
+        todo_list = Todo()
+        versions = [todo_list.get_version()]
+        task_id = todo_list.add_task("task")
+        versions.append(todo_list.get_version())
+        todo_list.complete_task(task_id)
+        versions.append(todo_list.get_version())
+        todo_list.delete_task(task_id)
+        versions.append(todo_list.get_version())
+        self.assertEqual(len(set(versions)), 4)
+        self.assertFalse(todo_list.delete_task(task_id))
+        self.assertEqual(todo_list.get_version(), versions[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
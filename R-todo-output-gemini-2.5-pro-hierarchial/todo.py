@@ -1,10 +1,32 @@
 # todo.py
 # A self-contained module for a simple task management system.
 
+import bisect
 import datetime
-from dataclasses import dataclass, field
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 from enum import IntEnum
-from typing import Any, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+# --- Clock ---
+
+# (local-midnight timestamp at which the date rolls over, current date)
+_today_cache: Tuple[float, datetime.date] = (0.0, datetime.date.min)
+
+def _today() -> datetime.date:
+    """
+    Returns the current local date. The date is only recomputed once the
+    cached day has ended, so repeated calls cost a time.time() comparison.
+    """
+    global _today_cache
+    rollover, today = _today_cache
+    if time.time() < rollover:
+        return today
+    today = datetime.date.today()
+    next_midnight = datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time())
+    _today_cache = (next_midnight.timestamp(), today)
+    return today
 
 # --- 3. Data Models ---
 
@@ -14,17 +36,51 @@ class Priority(IntEnum):
     MEDIUM = 2
     LOW = 3
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Task:
-    """Represents a single task in the to-do list."""
+    """
+    Represents a single task in the to-do list. Tasks are immutable: the Todo
+    indexes are sorted on their fields, so a change goes through Todo, which
+    swaps in an updated copy and re-indexes it.
+    """
     id: int
     description: str
     priority: Priority = Priority.MEDIUM
     deadline: Optional[datetime.date] = None
     is_completed: bool = False
-    creation_date: datetime.date = field(default_factory=datetime.date.today)
+    creation_date: datetime.date = field(default_factory=_today)
     completion_date: Optional[datetime.date] = None
 
+def _pending_key(task: Task):
+    """
+    Sort key for pending tasks: priority (high first), then deadline with
+    None last, then id so ties stay in creation order.
+    """
+    return (task.priority, task.deadline or datetime.date.max, task.id)
+
+def _completed_key(task: Task):
+    """Sort key for completed tasks: most recent completion first, then id."""
+    return (-task.completion_date.toordinal(), task.id)
+
+def _deadline_key(task: Task):
+    """Sort key for pending tasks that have a deadline: earliest deadline first, then id."""
+    return (task.deadline, task.id)
+
+def _id_key(task: Task) -> int:
+    """Sort key that keeps tasks in creation order."""
+    return task.id
+
+def _remove_from_bucket(buckets: Dict[datetime.date, List[Task]], day: datetime.date, task: Task) -> None:
+    """Removes a task from its date bucket, dropping the bucket once it is empty."""
+    bucket = buckets[day]
+    bucket.remove(task)
+    if not bucket:
+        del buckets[day]
+
+def _remove_sorted(index: List[Task], task: Task, key) -> None:
+    """Removes a task from a list kept sorted by key."""
+    del index[bisect.bisect_left(index, key(task), key=key)]
+
 # --- 4. Todo Class Design ---
 
 class Todo:
@@ -35,6 +91,19 @@ class Todo:
         """Initializes a new, empty Todo list manager."""
         self._tasks: Dict[int, Task] = {}
         self._next_id: int = 1
+        # Number of completed tasks, kept in step with _tasks
+        self._completed_count: int = 0
+        # Pending and completed tasks kept in display order, so the getters
+        # only copy instead of filtering and sorting every time
+        self._pending_index: List[Task] = []
+        self._completed_index: List[Task] = []
+        # Pending tasks that have a deadline, earliest first; overdue tasks form its prefix
+        self._pending_by_deadline: List[Task] = []
+        # Tasks bucketed by creation and completion date (each bucket in id order) for daily summaries
+        self._by_creation: DefaultDict[datetime.date, List[Task]] = defaultdict(list)
+        self._by_completion: DefaultDict[datetime.date, List[Task]] = defaultdict(list)
+        # Bumped on every change so callers can tell when cached views are stale
+        self._version: int = 0
 
     def add_task(
         self,
@@ -54,7 +123,12 @@ class Todo:
             deadline=deadline
         )
         self._tasks[task_id] = new_task
+        self._by_creation[new_task.creation_date].append(new_task)
+        bisect.insort(self._pending_index, new_task, key=_pending_key)
+        if deadline:
+            bisect.insort(self._pending_by_deadline, new_task, key=_deadline_key)
         self._next_id += 1
+        self._version += 1
         return task_id
 
     def delete_task(self, task_id: int) -> bool:
@@ -62,21 +136,55 @@ class Todo:
         Deletes a task from the system using its ID.
         Returns True if successful, False if the task ID was not found.
         """
-        if task_id in self._tasks:
-            del self._tasks[task_id]
-            return True
-        return False
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+        _remove_from_bucket(self._by_creation, task.creation_date, task)
+        if task.is_completed:
+            self._completed_count -= 1
+            _remove_sorted(self._completed_index, task, _completed_key)
+            _remove_from_bucket(self._by_completion, task.completion_date, task)
+        else:
+            self._remove_pending(task)
+        self._version += 1
+        return True
 
     def complete_task(self, task_id: int) -> Optional[Task]:
         """
-        Marks a task as completed. Sets is_completed to True and records the
-        completion_date. Returns the updated Task object if found, otherwise None.
+        Marks a task as completed. The stored Task is replaced by a copy with
+        is_completed set to True and the completion_date recorded.
+        Returns the updated Task object if found, otherwise None.
         """
         task = self.get_task(task_id)
-        if task:
-            task.is_completed = True
-            task.completion_date = datetime.date.today()
-        return task
+        if task is None:
+            return None
+        if task.is_completed:
+            _remove_sorted(self._completed_index, task, _completed_key)
+            _remove_from_bucket(self._by_completion, task.completion_date, task)
+        else:
+            self._remove_pending(task)
+            self._completed_count += 1
+        completed = replace(task, is_completed=True, completion_date=_today())
+        self._tasks[task_id] = completed
+        creation_bucket = self._by_creation[task.creation_date]
+        creation_bucket[bisect.bisect_left(creation_bucket, task_id, key=_id_key)] = completed
+        bisect.insort(self._completed_index, completed, key=_completed_key)
+        bisect.insort(self._by_completion[completed.completion_date], completed, key=_id_key)
+        self._version += 1
+        return completed
+
+    def _remove_pending(self, task: Task) -> None:
+        """Drops a pending task from the pending indexes."""
+        _remove_sorted(self._pending_index, task, _pending_key)
+        if task.deadline:
+            _remove_sorted(self._pending_by_deadline, task, _deadline_key)
+
+    def get_version(self) -> int:
+        """
+        Returns a counter that changes every time a task is added, completed
+        or deleted.
+        """
+        return self._version
 
     def get_task(self, task_id: int) -> Optional[Task]:
         """
@@ -90,36 +198,37 @@ class Todo:
         Returns a list of all tasks that are not yet completed, sorted by
         priority (high to low) and then by deadline (earliest first).
         """
-        pending = [task for task in self._tasks.values() if not task.is_completed]
-        # Sort by priority (ascending, since smaller number is higher priority),
-        # then by deadline. None deadlines are considered last.
-        pending.sort(key=lambda t: (t.priority, t.deadline or datetime.date.max))
-        return pending
+        return list(self._pending_index)
 
     def get_completed_tasks(self) -> List[Task]:
         """
         Returns a list of all tasks that have been marked as completed,
         sorted by completion date (most recent first).
         """
-        completed = [task for task in self._tasks.values() if task.is_completed]
-        # Sort by completion date, most recent first.
-        # Completion date cannot be None for a completed task.
-        completed.sort(key=lambda t: t.completion_date, reverse=True)
-        return completed
+        return list(self._completed_index)
 
     def get_overdue_tasks(self) -> List[Task]:
         """
         Returns a list of all pending tasks whose deadline has passed.
         The list is sorted by deadline (oldest first).
         """
-        today = datetime.date.today()
-        overdue = [
-            task for task in self._tasks.values()
-            if not task.is_completed and task.deadline and task.deadline < today
-        ]
-        # Sort by deadline, oldest first.
-        overdue.sort(key=lambda t: t.deadline)
-        return overdue
+        # Overdue tasks are the prefix of the deadline index that ends before today
+        by_deadline = self._pending_by_deadline
+        end = bisect.bisect_left(by_deadline, (_today(), 0), key=_deadline_key)
+        return by_deadline[:end]
+
+    def get_dashboard_snapshot(self) -> Tuple[List[Task], List[Task], List[Task], float]:
+        """
+        Returns the pending, completed and overdue task lists together with the
+        completion percentage, read straight from the maintained indexes. Each
+        list is sorted the same way as its individual getter.
+        """
+        return (
+            self.get_pending_tasks(),
+            self.get_completed_tasks(),
+            self.get_overdue_tasks(),
+            self.get_completion_percentage(),
+        )
 
     def get_completion_percentage(self) -> float:
         """
@@ -130,8 +239,7 @@ class Todo:
         if total_tasks == 0:
             return 0.0
 
-        completed_tasks = len(self.get_completed_tasks())
-        return (completed_tasks / total_tasks) * 100.0
+        return (self._completed_count / total_tasks) * 100.0
 
     def get_daily_summary(
         self,
@@ -142,25 +250,25 @@ class Todo:
         Defaults to the current day if no date is provided.
         """
         if summary_date is None:
-            summary_date = datetime.date.today()
-
-        tasks_created = [
-            task for task in self._tasks.values()
-            if task.creation_date == summary_date
-        ]
-
-        tasks_completed = [
-            task for task in self._tasks.values()
-            if task.completion_date == summary_date
-        ]
-        
+            summary_date = _today()
+
+        tasks_created = list(self._by_creation.get(summary_date, ()))
+        tasks_completed = list(self._by_completion.get(summary_date, ()))
+
         # A snapshot of tasks that were overdue on that day.
         # This means they were not completed and their deadline was before that day.
-        overdue_tasks_snapshot = [
-            task for task in self._tasks.values()
-            if (not task.is_completed or (task.completion_date and task.completion_date > summary_date))
-               and task.deadline and task.deadline < summary_date
-        ]
+        # Still-pending ones are a prefix of the deadline index; tasks completed after
+        # that day are a prefix of the completed index (most recent first).
+        by_deadline = self._pending_by_deadline
+        end = bisect.bisect_left(by_deadline, (summary_date, 0), key=_deadline_key)
+        overdue_tasks_snapshot = by_deadline[:end]
+        completed = self._completed_index
+        end = bisect.bisect_left(completed, (-summary_date.toordinal(), 0), key=_completed_key)
+        overdue_tasks_snapshot.extend(
+            task for task in completed[:end]
+            if task.deadline and task.deadline < summary_date
+        )
+        overdue_tasks_snapshot.sort(key=_id_key)
 
         return {
             "date": summary_date,
@@ -1,9 +1,264 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
+from crewai.tasks.task_output import TaskOutput
+from crewai_tools import CodeInterpreterTool
+import asyncio
+import atexit
+import copy
+import docker
+import functools
+import graphlib
+import os
+import random
 import subprocess
 import shutil
+import threading
+import time
+import yaml
 
-Agent._validate_docker_installation = lambda self: None if self.code_execution_mode != "safe" or shutil.which("docker") else (_ for _ in ()).throw(RuntimeError("Docker not found in PATH"))
+_DOCKER_PATH = shutil.which("docker")
+
+# Agents and crews print every step when verbose; off by default so batch runs
+# don't spend their time writing to stdout. Set PRESIDIO_VERBOSE=1 to watch a run.
+VERBOSE = os.environ.get("PRESIDIO_VERBOSE", "0") == "1"
+
+Agent._validate_docker_installation = lambda self: None if self.code_execution_mode != "safe" or _DOCKER_PATH else (_ for _ in ()).throw(RuntimeError("Docker not found in PATH"))
+
+# CrewAI retries a failed task by calling execute_task again from inside the failed
+# call; back off exponentially before each retry so a struggling Docker daemon or
+# API isn't hammered. Attempts are counted per (agent, task) invocation on this
+# thread, because crewai's own _times_executed is never reset after a success.
+# Failures inside executed code come back as tool output and litellm errors are
+# re-raised without retrying, so neither reaches here.
+_original_execute_task = Agent.execute_task
+_task_attempts = threading.local()
+
+def _execute_task_with_backoff(self, task, context=None, tools=None):
+    attempts = _task_attempts.__dict__.setdefault("by_call", {})
+    key = (id(self), id(task))
+    if key in attempts:
+        attempts[key] += 1
+        time.sleep(min(2 ** attempts[key], 30) + random.random())
+        return _original_execute_task(self, task, context, tools)
+
+    attempts[key] = 0
+    try:
+        return _original_execute_task(self, task, context, tools)
+    finally:
+        del attempts[key]
+        self._times_executed = 0
+
+Agent.execute_task = _execute_task_with_backoff
+
+# Safe-mode code execution normally starts a fresh container and pip-installs the
+# requested libraries on every call. Keep a small pool of warm containers instead,
+# keyed on the Docker daemon, image and library set, so a container only ever holds
+# the libraries its callers asked for. A container serves one call at a time.
+# After each call, leftover processes are killed and /tmp is wiped. The container
+# goes back to the pool only if its filesystem still matches the state recorded
+# right after the libraries were installed. Otherwise (for example, the code
+# pip-installed something or wrote outside /tmp) it is removed, so the next call
+# never sees another call's leftovers. The mounted /workspace is the host working
+# directory and is shared, as it is with the tool's own fresh containers.
+# Containers idle for longer than _SANDBOX_IDLE_SECONDS are removed, and the rest
+# are removed at exit. Nothing is started until the first code-execution call.
+_SANDBOX_IDLE_SECONDS = 300
+_idle_sandboxes = {}  # pool key -> [(container, time it was returned)]
+_live_sandboxes = {}  # container id -> container, for cleanup at exit
+_sandbox_baselines = {}  # container id -> filesystem changes right after setup
+_sandbox_lock = threading.Lock()
+
+def _remove_sandbox(container):
+    with _sandbox_lock:
+        _live_sandboxes.pop(container.id, None)
+        _sandbox_baselines.pop(container.id, None)
+    try:
+        container.remove(force=True)
+    except Exception:
+        pass
+
+def _stop_sandboxes():
+    for container in list(_live_sandboxes.values()):
+        _remove_sandbox(container)
+
+atexit.register(_stop_sandboxes)
+
+def _take_idle_sandbox(key):
+    # Pops an idle container for key (or None) and evicts containers idle for too long
+    now = time.monotonic()
+    expired = []
+    with _sandbox_lock:
+        for pool_key, idle in list(_idle_sandboxes.items()):
+            fresh = [(container, returned) for container, returned in idle if now - returned < _SANDBOX_IDLE_SECONDS]
+            expired.extend(container for container, returned in idle if now - returned >= _SANDBOX_IDLE_SECONDS)
+            if fresh:
+                _idle_sandboxes[pool_key] = fresh
+            else:
+                del _idle_sandboxes[pool_key]
+        idle = _idle_sandboxes.get(key)
+        container = idle.pop()[0] if idle else None
+    for stale in expired:
+        _remove_sandbox(stale)
+    return container
+
+def _checkout_sandbox(tool, libraries):
+    key = (tool.user_docker_base_url, tool.default_image_tag, libraries)
+    container = _take_idle_sandbox(key)
+    while container is not None:
+        try:
+            container.reload()
+            if container.status == "running":
+                return key, container
+        except Exception:
+            pass
+        _remove_sandbox(container)
+        container = _take_idle_sandbox(key)
+
+    _ensure_sandbox_image(tool)
+    container = _start_sandbox_container(tool)
+    with _sandbox_lock:
+        _live_sandboxes[container.id] = container
+    try:
+        tool._install_libraries(container, list(libraries))
+        baseline = _filesystem_changes(container)
+    except Exception:
+        _remove_sandbox(container)
+        raise
+    with _sandbox_lock:
+        _sandbox_baselines[container.id] = baseline
+    return key, container
+
+def _filesystem_changes(container):
+    # Paths the container has changed relative to its image, ignoring /tmp (wiped between calls)
+    return frozenset(
+        (change["Path"], change["Kind"])
+        for change in container.diff() or ()
+        if change["Path"] != "/tmp" and not change["Path"].startswith("/tmp/")
+    )
+
+def _return_sandbox(key, container):
+    try:
+        # kill -1 signals every process the exec user may signal except init and the shell itself
+        container.exec_run(["sh", "-c", "kill -9 -1 2>/dev/null; rm -rf /tmp/* /tmp/.[!.]*; true"])
+        clean = _filesystem_changes(container) == _sandbox_baselines.get(container.id)
+    except Exception:
+        clean = False
+    if not clean:
+        _remove_sandbox(container)
+        return
+    with _sandbox_lock:
+        _idle_sandboxes.setdefault(key, []).append((container, time.monotonic()))
+
+def _start_sandbox_container(tool):
+    # Same container the tool would start (its image and Docker daemon, the working
+    # directory mounted at /workspace), with all capabilities dropped and privilege
+    # escalation disabled. Networking stays on because the tool pip-installs the
+    # requested libraries inside the container.
+    if tool.user_docker_base_url is None:
+        client = docker.from_env()
+    else:
+        client = docker.DockerClient(base_url=tool.user_docker_base_url)
+    return client.containers.run(
+        tool.default_image_tag,
+        detach=True,
+        tty=True,
+        working_dir="/workspace",
+        volumes={os.getcwd(): {"bind": "/workspace", "mode": "rw"}},
+        cap_drop=["ALL"],
+        security_opt=["no-new-privileges"],
+    )
+
+_verified_images = set()  # (Docker daemon, image tag) pairs checked or built in this process
+_image_lock = threading.Lock()
+
+def _ensure_sandbox_image(tool):
+    # Builds or checks the sandbox image once per daemon and tag; concurrent callers wait here
+    image_key = (tool.user_docker_base_url, tool.default_image_tag)
+    with _image_lock:
+        if image_key not in _verified_images:
+            tool._verify_docker_image()
+            _verified_images.add(image_key)
+
+_image_prewarm_started = False
+
+def _prewarm_sandbox_image():
+    """
+    Builds the sandbox image if needed in a background thread, once per process,
+    so the first code-execution call doesn't pay for the build. No container is
+    started here; a call that arrives before the build finishes waits on it.
+    """
+    global _image_prewarm_started
+    if _image_prewarm_started or not _DOCKER_PATH:
+        return
+    _image_prewarm_started = True
+
+    def warm():
+        try:
+            _ensure_sandbox_image(CodeInterpreterTool())
+        except Exception:
+            pass  # The first real call retries and reports the error
+
+    threading.Thread(target=warm, daemon=True).start()
+
+def _run_code_in_warm_docker(self, code, libraries_used):
+    key, container = _checkout_sandbox(self, tuple(sorted(set(libraries_used or ()))))
+    try:
+        exec_result = container.exec_run(["python3", "-c", code])
+    except Exception:
+        _remove_sandbox(container)
+        raise
+    _return_sandbox(key, container)
+    if exec_result.exit_code != 0:
+        return f"Something went wrong while running the code: \n{exec_result.output.decode('utf-8')}"
+    return exec_result.output.decode("utf-8")
+
+CodeInterpreterTool.run_code_in_docker = _run_code_in_warm_docker
+
+# Parsed agent/task configs keyed on (path, mtime), so building several crews in one
+# process parses each YAML file once. CrewBase rewrites the loaded dicts in place
+# (agent names become Agent objects), so every caller gets its own deep copy.
+@functools.lru_cache(maxsize=128)
+def _parse_yaml(config_path, mtime_ns):
+    with open(config_path, "r", encoding="utf-8") as file:
+        return yaml.safe_load(file)
+
+def _load_yaml_cached(config_path):
+    return copy.deepcopy(_parse_yaml(str(config_path), os.stat(config_path).st_mtime_ns))
+
+# Task checkpoints: one file per task holding its raw output. Each is written to a
+# temporary file first and moved into place, so a crash mid-write never leaves a
+# truncated checkpoint behind.
+def _checkpoint_path(checkpoint_dir, name):
+    return os.path.join(checkpoint_dir, f"{name}.txt")
+
+def _attach_checkpoint(checkpoint_dir, name, task):
+    if checkpoint_dir is None:
+        return
+    path = _checkpoint_path(checkpoint_dir, name)
+
+    def save(output):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(output.raw)
+        os.replace(tmp_path, path)
+
+    task.callback = save
+
+def _restore_checkpoint(checkpoint_dir, name, task, inputs):
+    # Gives the task a saved output (so later tasks can use it as context), writes
+    # its output_file again as a normal run would, and returns the output
+    if checkpoint_dir is None:
+        return None
+    path = _checkpoint_path(checkpoint_dir, name)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as file:
+        raw = file.read()
+    task.interpolate_inputs_and_add_conversation_history(inputs)
+    task.output = TaskOutput(description=task.description, raw=raw, agent=task.agent.role if task.agent else "")
+    if task.output_file:
+        task._save_file(raw)
+    return task.output
 
 @CrewBase
 class PresidioTeam():
@@ -12,18 +267,21 @@ class PresidioTeam():
     agents_config = 'config/agents.yaml'
     tasks_config = 'config/tasks.yaml'
 
+    def __init__(self):
+        _prewarm_sandbox_image()
+
     @agent
     def engineering_lead(self) -> Agent:
         return Agent(
             config=self.agents_config['engineering_lead'],
-            verbose=True,
+            verbose=VERBOSE,
         )
 
     @agent
     def backend_engineer(self) -> Agent:
         return Agent(
             config=self.agents_config['backend_engineer'],
-            verbose=True,
+            verbose=VERBOSE,
             allow_code_execution=True,
             code_execution_mode="safe",  # Uses Docker for safety
             max_execution_time=500, 
@@ -34,14 +292,14 @@ class PresidioTeam():
     def frontend_engineer(self) -> Agent:
         return Agent(
             config=self.agents_config['frontend_engineer'],
-            verbose=True,
+            verbose=VERBOSE,
         )
     
     @agent
     def test_engineer(self) -> Agent:
         return Agent(
             config=self.agents_config['test_engineer'],
-            verbose=True,
+            verbose=VERBOSE,
             allow_code_execution=True,
             code_execution_mode="safe",  # Uses Docker for safety
             max_execution_time=500, 
@@ -79,5 +337,53 @@ class PresidioTeam():
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            verbose=True,
-        )
\ No newline at end of file
+            verbose=VERBOSE,
+        )
+
+    def kickoff_parallel(self, inputs, checkpoint_dir=None):
+        """
+        Runs the tasks as a dependency graph built from each task's context in
+        tasks.yaml: every task starts as soon as the tasks it takes context from
+        have finished, so independent tasks (frontend and test, which both only
+        need the code task) run concurrently.
+        A sequential Crew may not end with more than one async task, so each task
+        runs as its own single-task crew.
+        With checkpoint_dir set, each task's raw output is saved there as it
+        finishes, and tasks that already have a checkpoint are restored instead
+        of being run again. The directory is removed once every task has
+        finished, so only an interrupted run is ever resumed.
+        Returns the outputs of the tasks no other task depends on, in tasks.yaml
+        order.
+        """
+        tasks = {name: getattr(self, name)() for name in self.tasks_config}
+        names_by_task = {id(task): name for name, task in tasks.items()}
+        depends_on = {
+            name: [names_by_task[id(dep)] for dep in (task.context if isinstance(task.context, list) else [])]
+            for name, task in tasks.items()
+        }
+        if checkpoint_dir is not None:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+
+        async def run_task(name, running):
+            await asyncio.gather(*(running[dep] for dep in depends_on[name]))
+            task = tasks[name]
+            restored = _restore_checkpoint(checkpoint_dir, name, task, inputs)
+            if restored is not None:
+                return restored
+            _attach_checkpoint(checkpoint_dir, name, task)
+            return await Crew(agents=[task.agent], tasks=[task], verbose=VERBOSE).kickoff_async(inputs=inputs)
+
+        async def run_graph():
+            running = {}
+            for name in graphlib.TopologicalSorter(depends_on).static_order():
+                running[name] = asyncio.ensure_future(run_task(name, running))
+            await asyncio.gather(*running.values())
+            return running
+
+        running = asyncio.run(run_graph())
+        if checkpoint_dir is not None:
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        needed = {dep for deps in depends_on.values() for dep in deps}
+        return [running[name].result() for name in tasks if name not in needed]
+
+PresidioTeam.load_yaml = staticmethod(_load_yaml_cached)
\ No newline at end of file
@@ -1,16 +1,11 @@
 #!/usr/bin/env python
 import sys
 import warnings
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from presidio.crew import PresidioTeam
-
-warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
-
-# Create output directory if it doesn't exist
-os.makedirs('output', exist_ok=True)
-
 # Ecommerce
 
 requirements = """
@@ -25,6 +20,41 @@ module_name = "todo.py"
 class_name = "Todo"
 
 
+def load_crew_class():
+    """
+    Prepares the environment for a run and returns the crew class. crewai and its
+    dependencies are imported here rather than at module import, so importing
+    this module stays cheap.
+    """
+    warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
+
+    # Create output directory if it doesn't exist
+    os.makedirs('output', exist_ok=True)
+
+    from presidio.crew import PresidioTeam
+    return PresidioTeam
+
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config')
+
+
+def checkpoint_dir_for(inputs):
+    """
+    Returns the checkpoint directory for a set of crew inputs, keyed by a hash
+    of the inputs and of the agent/task configs (which name the model), so
+    different requirement sets or an edited config never share checkpoints.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for name in ('requirements', 'module_name', 'class_name'):
+        digest.update(inputs[name].encode("utf-8"))
+        digest.update(b"\0")
+    for config_name in ('agents.yaml', 'tasks.yaml'):
+        with open(os.path.join(CONFIG_DIR, config_name), 'rb') as file:
+            digest.update(file.read())
+        digest.update(b"\0")
+    return os.path.join('output', 'checkpoints', digest.hexdigest())
+
+
 def run():
     """
     Run the research crew.
@@ -35,9 +65,47 @@ def run():
         'class_name': class_name
     }
 
-    # Create and run the crew
-    result = PresidioTeam().crew().kickoff(inputs=inputs)
-    print(result)
+    # Create and run the crew; the frontend and test tasks run side by side.
+    # Outputs are checkpointed per input set and config, so a rerun after an interrupted
+    # run resumes after the last finished task; a completed run clears its checkpoints.
+    PresidioTeam = load_crew_class()
+    frontend_result, test_result = PresidioTeam().kickoff_parallel(
+        inputs=inputs, checkpoint_dir=checkpoint_dir_for(inputs)
+    )
+    print(frontend_result)
+    print(test_result)
+
+
+def run_batch(items, max_workers=8):
+    """
+    Run the crew for several requirement sets concurrently.
+    Each item is a (requirements, module_name, class_name) tuple; the
+    (frontend, test) results are returned in the same order as the items.
+    """
+    inputs_list = [
+        {
+            'requirements': item_requirements,
+            'module_name': item_module_name,
+            'class_name': item_class_name
+        }
+        for item_requirements, item_module_name, item_class_name in items
+    ]
+
+    PresidioTeam = load_crew_class()
+
+    # Each kickoff is I/O-bound on model calls; every thread builds its own crew
+    # because crew state is not safe to share between concurrent runs. Items that
+    # were partly done in an earlier batch resume from their checkpoints.
+    def kickoff(inputs):
+        return PresidioTeam().kickoff_parallel(inputs=inputs, checkpoint_dir=checkpoint_dir_for(inputs))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(kickoff, inputs_list))
+
+    for frontend_result, test_result in results:
+        print(frontend_result)
+        print(test_result)
+    return results
 
 
 if __name__ == "__main__":